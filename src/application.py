@@ -1,4 +1,5 @@
 import asyncio
+import gc
 import json
 import signal
 import sys
@@ -314,6 +315,12 @@ class Application:
         # Initialize shortcut manager
         await self._initialize_shortcuts()
 
+        # Move everything allocated during startup (models, configs, Qt/asyncio objects) out of
+        # the cyclic GC's view, so collections during audio processing only scan new objects.
+        # Long-lived caches should be created before this point
+        gc.collect()
+        gc.freeze()
+
         logger.info("Application components initialization completed")
 
     async def _initialize_audio(self):
@@ -1403,6 +1410,11 @@ class Application:
             # 7. Close MCP server
             await self._safe_close_resource(self.mcp_server, "MCP server")
 
+            # Close the OTA client's HTTP session
+            from src.core.ota import Ota
+
+            await self._safe_close_resource(Ota, "OTA client", "close_instance")
+
             # 8. Clean up queues
             try:
                 for q in [
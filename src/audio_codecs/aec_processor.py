@@ -191,7 +191,7 @@ class AECProcessor:
         # frames, time_info used for sounddevice callback, not used here but signature must be preserved
         _ = frames, time_info
         
-        if status and "overflow" not in str(status).lower():
+        if status and not status.input_overflow:
             logger.warning(f"Reference signal stream status: {status}")
         
         if self._is_closing:
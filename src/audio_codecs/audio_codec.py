@@ -1,7 +1,9 @@
 import asyncio
+import ctypes
 import gc
-import time
+import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import numpy as np
@@ -10,6 +12,7 @@ import sounddevice as sd
 import soxr
 
 from src.audio_codecs.aec_processor import AECProcessor
+from src.audio_codecs.ring_buffer import AudioRingBuffer
 from src.constants.constants import AudioConfig
 from src.utils.config_manager import ConfigManager
 from src.utils.logging_config import get_logger
@@ -25,6 +28,16 @@ class AudioCodec:
     2. Playback: Receive -> Opus decode to 24kHz -> Playback queue -> Speaker
     """
 
+    # Number of frame slots between the input callback and the encode worker
+    ENCODE_QUEUE_SLOTS = 8
+    # Max decoded frames resampled per resample_chunk call when playback has a backlog
+    OUTPUT_RESAMPLE_BATCH_FRAMES = 3
+    # soxr quality recipes accepted for AUDIO_DEVICES.resample_quality
+    RESAMPLE_QUALITIES = ("QQ", "LQ", "MQ", "HQ", "VHQ")
+    DEFAULT_RESAMPLE_QUALITY = "HQ"
+    # Samples in one decoded Opus frame
+    _EXPECTED_DECODE_LEN = AudioConfig.OUTPUT_FRAME_SIZE * AudioConfig.CHANNELS
+
     def __init__(self):
         # Get configuration manager
         self.config = ConfigManager.get_instance()
@@ -43,9 +56,14 @@ class AudioCodec:
         self.input_resampler = None  # Device sample rate -> 16kHz
         self.output_resampler = None  # 24kHz -> Device sample rate (for playback)
 
-        # Resampling buffers
-        self._resample_input_buffer = deque()
-        self._resample_output_buffer = deque()
+        # Resampling ring buffers (created together with the resamplers)
+        self._resample_input_buffer = None
+        self._resample_output_buffer = None
+        # The resample rings are produced and consumed inside their PortAudio callback, so
+        # clear_audio_queue bumps this and each callback clears its own ring when it changes
+        self._resample_clear_generation = 0
+        self._input_resample_generation = 0
+        self._output_resample_generation = 0
 
         self._device_input_frame_size = None
         self._is_closing = False
@@ -54,32 +72,75 @@ class AudioCodec:
         self.input_stream = None  # Recording stream
         self.output_stream = None  # Playback stream
 
-        # Queues: Wake word detection and playback buffer
-        self._wakeword_buffer = asyncio.Queue(maxsize=100)
-        self._output_buffer = asyncio.Queue(maxsize=500)
+        # Wake word queue, filled from the PortAudio callback thread: bounded deque
+        # (append/popleft are atomic under the GIL) instead of asyncio.Queue, which is not thread-safe
+        self._wakeword_buffer = deque(maxlen=100)
+        # Wakes a consumer awaiting wake word audio; only signalled while someone is waiting
+        self._wakeword_event = asyncio.Event()
+        self._wakeword_waiting = False
+        self._loop = None  # Event loop owning _wakeword_event, captured in initialize()
+        # Optional VAD tap: a second bounded frame queue, only filled while a VAD detector is attached
+        self._vad_buffer = None
+        # Wakes a consumer awaiting VAD audio; only signalled while someone is waiting
+        self._vad_event = asyncio.Event()
+        self._vad_waiting = False
+
+        # Playback buffer: SPSC sample ring, the decoder writes 24kHz PCM and the output callback
+        # copies contiguous slices straight into outdata (same ~500 frame bound as before)
+        self._output_buffer = AudioRingBuffer(
+            AudioConfig.OUTPUT_FRAME_SIZE * AudioConfig.CHANNELS * 500, overwrite=False
+        )
+        # Set from the output callback when the playback ring drains, only while someone is waiting
+        self._output_drained = asyncio.Event()
+        self._drain_waiting = False
+        self._output_resample_scratch = None  # 24kHz chunk fed to the output resampler
+
+        # Direct playback path specialized for the channel layout (mono skips the reshape)
+        self._output_direct = (
+            self._output_callback_mono_direct
+            if AudioConfig.CHANNELS == 1
+            else self._output_callback_direct
+        )
 
         # Real-time encoding callback (direct send, not through queue)
         self._encoded_audio_callback = None
 
+        # Preallocated int16 PCM buffer for Opus encoding. opuslib accepts any ctypes-castable
+        # buffer, so the encoder reads this array directly without a per-frame bytes object
+        self._pcm_scratch = (
+            ctypes.c_char * (AudioConfig.INPUT_FRAME_SIZE * AudioConfig.CHANNELS * 2)
+        )()
+        self._pcm_scratch_view = np.frombuffer(self._pcm_scratch, dtype=np.int16)
+
+        # Encode worker: the input callback copies frames into a preallocated SPSC slot ring and a
+        # background thread runs Opus encoding and the send callback, off the PortAudio thread
+        self._encode_slots = None  # (slots, frame) array, created in initialize()
+        self._encode_head = 0  # Frames written by the input callback (producer)
+        self._encode_tail = 0  # Frames consumed by the encode worker (consumer)
+        self._encode_dropped = 0
+        self._encode_event = threading.Event()
+        self._encode_thread = None
+
+        # Decode worker: one thread keeps Opus decodes in submission order while the event loop
+        # keeps reading the network; concurrency is bounded by the caller's write semaphore
+        self._decode_exec = None
+        self._output_generation = 0  # Bumped by clear_audio_queue so in-flight decodes are dropped
+
         # AEC processor
         self.aec_processor = AECProcessor()
         self._aec_enabled = False
+        self._aec_task = None  # Background AEC bring-up task
 
     # -----------------------
     # Helper methods for automatic device selection
     # -----------------------
-    def _auto_pick_device(self, kind: str) -> Optional[int]:
+    def _auto_pick_device(self, kind: str, devices, hostapis) -> Optional[int]:
         """
         Automatically select a stable device index (prefer WASAPI).
         kind: 'input' or 'output'
+        devices/hostapis: Enumeration from sd.query_devices()/sd.query_hostapis()
         """
         assert kind in ("input", "output")
-        try:
-            devices = sd.query_devices()
-            hostapis = sd.query_hostapis()
-        except Exception as e:
-            logger.warning(f"Failed to enumerate devices: {e}")
-            return None
 
         # 1) Prefer WASAPI HostAPI default device (if available)
         wasapi_index = None
@@ -105,28 +166,26 @@ class AudioCodec:
         except Exception:
             default_name = None
 
-        scored = []
-        for i, d in enumerate(devices):
-            if kind == "input":
-                ok = d["max_input_channels"] > 0
-            else:
-                ok = d["max_output_channels"] > 0
-            if not ok:
-                continue
-            host_name = hostapis[d["hostapi"]]["name"]
-            score = 0
-            if "WASAPI" in host_name:
-                score += 5
-            if default_name and d["name"] == default_name:
-                score += 10
-            # Small bonus: Common available endpoint keywords
-            if any(k in d["name"] for k in ["Speaker", "扬声器", "Realtek", "USB", "AMD", "HDMI", "Monitor"]):
-                score += 1
-            scored.append((score, i))
+        # Prebuild per-hostapi WASAPI flags and the channel key once
+        is_wasapi = ["WASAPI" in ha["name"] for ha in hostapis]
+        channel_key = "max_input_channels" if kind == "input" else "max_output_channels"
+        keywords = ("Speaker", "扬声器", "Realtek", "USB", "AMD", "HDMI", "Monitor")
+
+        scored = [
+            (
+                (5 if is_wasapi[d["hostapi"]] else 0)
+                + (10 if default_name and d["name"] == default_name else 0)
+                # Small bonus: Common available endpoint keywords
+                + (1 if any(k in d["name"] for k in keywords) else 0),
+                i,
+            )
+            for i, d in enumerate(devices)
+            if d[channel_key] > 0
+        ]
 
         if scored:
-            scored.sort(reverse=True)
-            return scored[0][1]
+            # max() keeps the previous tie-break (highest score, then highest index) without a full sort
+            return max(scored)[1]
 
         # 3) Final fallback: First device with available channels
         for i, d in enumerate(devices):
@@ -140,18 +199,28 @@ class AudioCodec:
         """
         Initialize audio devices.
         """
+        self._loop = asyncio.get_running_loop()
+
         try:
+            # Enumerate devices once and share the result with device selection
+            try:
+                devices = sd.query_devices()
+                hostapis = sd.query_hostapis()
+            except Exception as e:
+                logger.warning(f"Failed to enumerate devices: {e}")
+                devices, hostapis = [], []
+
             # Display and select audio devices (automatically selected and written to config on first run; not overwritten afterwards)
-            await self._select_audio_devices()
+            await self._select_audio_devices(devices, hostapis)
 
             # Safely get input/output default information (avoid -1)
-            if self.mic_device_id is not None and self.mic_device_id >= 0:
-                input_device_info = sd.query_devices(self.mic_device_id)
+            if self.mic_device_id is not None and 0 <= self.mic_device_id < len(devices):
+                input_device_info = devices[self.mic_device_id]
             else:
                 input_device_info = sd.query_devices(kind="input")
 
-            if self.speaker_device_id is not None and self.speaker_device_id >= 0:
-                output_device_info = sd.query_devices(self.speaker_device_id)
+            if self.speaker_device_id is not None and 0 <= self.speaker_device_id < len(devices):
+                output_device_info = devices[self.speaker_device_id]
             else:
                 output_device_info = sd.query_devices(kind="output")
 
@@ -183,15 +252,13 @@ class AudioCodec:
             self.opus_decoder = opuslib.Decoder(
                 AudioConfig.OUTPUT_SAMPLE_RATE, AudioConfig.CHANNELS
             )
+            self._start_encode_worker()
+            self._decode_exec = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="AudioDecodeWorker"
+            )
 
-            # Initialize AEC processor
-            try:
-                await self.aec_processor.initialize()
-                self._aec_enabled = True
-                logger.info("AEC processor enabled")
-            except Exception as e:
-                logger.warning(f"AEC processor initialization failed, will use raw audio: {e}")
-                self._aec_enabled = False
+            # Initialize AEC processor in the background, raw audio passes through until ready
+            self._aec_task = asyncio.create_task(self._bring_up_aec())
 
             logger.info("Audio initialization completed")
         except Exception as e:
@@ -199,10 +266,90 @@ class AudioCodec:
             await self.close()
             raise
 
+    def _start_encode_worker(self):
+        """
+        Start the Opus encode worker thread.
+        """
+        self._encode_slots = np.zeros(
+            (self.ENCODE_QUEUE_SLOTS, AudioConfig.INPUT_FRAME_SIZE * AudioConfig.CHANNELS),
+            dtype=np.int16,
+        )
+        self._encode_head = 0
+        self._encode_tail = 0
+        self._encode_thread = threading.Thread(
+            target=self._encode_worker, name="AudioEncodeWorker", daemon=True
+        )
+        self._encode_thread.start()
+
+    def _encode_worker(self):
+        """
+        Drain queued capture frames, encode them and hand them to the encoding callback.
+        """
+        slots = self._encode_slots
+        slot_count = len(slots)
+        frame_size = AudioConfig.INPUT_FRAME_SIZE
+
+        while not self._is_closing:
+            self._encode_event.wait()
+            self._encode_event.clear()
+
+            while self._encode_tail < self._encode_head and not self._is_closing:
+                frame = slots[self._encode_tail % slot_count]
+                try:
+                    np.copyto(self._pcm_scratch_view, frame)
+                    encoded_data = self.opus_encoder.encode(
+                        self._pcm_scratch, frame_size
+                    )
+                    callback = self._encoded_audio_callback
+                    if encoded_data and callback:
+                        callback(encoded_data)
+                except Exception as e:
+                    logger.warning(f"Real-time recording encoding failed: {e}")
+                finally:
+                    self._encode_tail += 1
+
+    def _stop_encode_worker(self):
+        """
+        Stop the Opus encode worker thread (requires _is_closing to be set).
+        """
+        self._encode_event.set()
+        if self._encode_thread and self._encode_thread.is_alive():
+            self._encode_thread.join(timeout=1.0)
+        self._encode_thread = None
+
+    async def _bring_up_aec(self):
+        """
+        Initialize AEC processor without blocking device bring-up.
+        """
+        try:
+            await self.aec_processor.initialize()
+            self._aec_enabled = True
+            logger.info("AEC processor enabled")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"AEC processor initialization failed, will use raw audio: {e}")
+            self._aec_enabled = False
+
     async def _create_resamplers(self):
         """
         Create resamplers Input: Device sample rate -> 16kHz (for encoding) Output: 24kHz -> Device sample rate (for playback)
+
+        soxr.ResampleStream is the streaming API for per-callback chunks. Quality sets the filter length:
+        "HQ" costs a little more CPU but removes aliasing that hurts AEC, wake word and Opus;
+        set AUDIO_DEVICES.resample_quality to "QQ" on CPU-bound devices.
         """
+        quality = self.config.get_config(
+            "AUDIO_DEVICES.resample_quality", self.DEFAULT_RESAMPLE_QUALITY
+        ) or self.DEFAULT_RESAMPLE_QUALITY
+        if quality not in self.RESAMPLE_QUALITIES:
+            # An invalid recipe would make soxr raise and abort audio initialization
+            logger.warning(
+                f"Invalid resample_quality {quality!r}, expected one of "
+                f"{', '.join(self.RESAMPLE_QUALITIES)}; using {self.DEFAULT_RESAMPLE_QUALITY}"
+            )
+            quality = self.DEFAULT_RESAMPLE_QUALITY
+
         # Input resampler: Device sample rate -> 16kHz (for encoding)
         if self.device_input_sample_rate != AudioConfig.INPUT_SAMPLE_RATE:
             self.input_resampler = soxr.ResampleStream(
@@ -210,9 +357,15 @@ class AudioCodec:
                 AudioConfig.INPUT_SAMPLE_RATE,
                 AudioConfig.CHANNELS,
                 dtype="int16",
-                quality="QQ",
+                quality=quality,
+            )
+            self._resample_input_buffer = AudioRingBuffer(
+                AudioConfig.INPUT_FRAME_SIZE * AudioConfig.CHANNELS * 4,
+                dtype=np.int16,
+            )
+            logger.info(
+                f"Input resampling: {self.device_input_sample_rate}Hz -> 16kHz (quality {quality})"
             )
-            logger.info(f"Input resampling: {self.device_input_sample_rate}Hz -> 16kHz")
 
         # Output resampler: 24kHz -> Device sample rate
         if self.device_output_sample_rate != AudioConfig.OUTPUT_SAMPLE_RATE:
@@ -221,13 +374,28 @@ class AudioCodec:
                 self.device_output_sample_rate,
                 AudioConfig.CHANNELS,
                 dtype="int16",
-                quality="QQ",
+                quality=quality,
+            )
+            device_output_frame_size = int(
+                self.device_output_sample_rate * (AudioConfig.FRAME_DURATION / 1000)
+            )
+            # Room for a full resample batch on top of a partially drained block
+            self._resample_output_buffer = AudioRingBuffer(
+                device_output_frame_size
+                * AudioConfig.CHANNELS
+                * (self.OUTPUT_RESAMPLE_BATCH_FRAMES + 2)
+            )
+            self._output_resample_scratch = np.empty(
+                AudioConfig.OUTPUT_FRAME_SIZE
+                * AudioConfig.CHANNELS
+                * self.OUTPUT_RESAMPLE_BATCH_FRAMES,
+                dtype=np.int16,
             )
             logger.info(
                 f"Output resampling: {AudioConfig.OUTPUT_SAMPLE_RATE}Hz -> {self.device_output_sample_rate}Hz"
             )
 
-    async def _select_audio_devices(self):
+    async def _select_audio_devices(self, devices, hostapis):
         """
         Display and select audio devices.
         Prefer devices from configuration file, if not available then automatically select and save to config (only written on first run, not overwritten afterwards).
@@ -242,8 +410,6 @@ class AudioCodec:
             input_device_id = audio_config.get("input_device_id")
             output_device_id = audio_config.get("output_device_id")
 
-            devices = sd.query_devices()
-
             # --- Validate input device from configuration ---
             if input_device_id is not None:
                 try:
@@ -289,7 +455,7 @@ class AudioCodec:
             picked_output = self.speaker_device_id
 
             if picked_input is None:
-                picked_input = self._auto_pick_device("input")
+                picked_input = self._auto_pick_device("input", devices, hostapis)
                 if picked_input is not None:
                     self.mic_device_id = picked_input
                     d = devices[picked_input]
@@ -298,7 +464,7 @@ class AudioCodec:
                     logger.warning("No available input device found (will use system default and not write index).")
 
             if picked_output is None:
-                picked_output = self._auto_pick_device("output")
+                picked_output = self._auto_pick_device("output", devices, hostapis)
                 if picked_output is not None:
                     self.speaker_device_id = picked_output
                     d = devices[picked_output]
@@ -310,6 +476,7 @@ class AudioCodec:
             need_write = (not had_cfg_input and picked_input is not None) or (not had_cfg_output and picked_output is not None)
             if need_write:
                 await self._save_default_audio_config(
+                    devices,
                     input_device_id=picked_input if not had_cfg_input else None,
                     output_device_id=picked_output if not had_cfg_output else None,
                 )
@@ -320,12 +487,11 @@ class AudioCodec:
             self.mic_device_id = self.mic_device_id if isinstance(self.mic_device_id, int) else None
             self.speaker_device_id = self.speaker_device_id if isinstance(self.speaker_device_id, int) else None
 
-    async def _save_default_audio_config(self, input_device_id: Optional[int], output_device_id: Optional[int]):
+    async def _save_default_audio_config(self, devices, input_device_id: Optional[int], output_device_id: Optional[int]):
         """
         Save default audio device configuration to config file (only for non-empty devices passed in; will not overwrite existing fields).
         """
         try:
-            devices = sd.query_devices()
             audio_config_patch = {}
 
             # Save input device configuration
@@ -389,6 +555,8 @@ class AudioCodec:
                     self.device_output_sample_rate * (AudioConfig.FRAME_DURATION / 1000)
                 )
 
+            # int16 is handed to PortAudio as-is (no float32 round trip); outdata stays an ndarray
+            # so the callbacks can read_into() it without wrapping a raw buffer each block
             self.output_stream = sd.OutputStream(
                 device=self.speaker_device_id,  # None=system default; or fixed index
                 samplerate=output_sample_rate,
@@ -413,14 +581,22 @@ class AudioCodec:
         """
         Recording callback, called by hardware driver. Processing flow: Raw audio -> Resample to 16kHz -> Encoding send + Wake word detection.
         """
-        if status and "overflow" not in str(status).lower():
+        # Check PortAudio status flags directly instead of formatting the status string
+        if status and not status.input_overflow:
             logger.warning(f"Input stream status: {status}")
 
         if self._is_closing:
             return
 
+        # Hoist hot attribute lookups to locals (callback runs every frame)
+        frame_size = AudioConfig.INPUT_FRAME_SIZE
+        encoded_audio_callback = self._encoded_audio_callback
+
         try:
-            audio_data = indata.copy().flatten()
+            # Zero-copy view of the PortAudio buffer: the resampler writes into its own ring,
+            # and every consumer below (AEC, encoder scratch, wake word bytes) copies before
+            # the callback returns, so the buffer is never retained
+            audio_data = indata.reshape(-1)
 
             # Resample to 16kHz (if device is not 16kHz)
             if self.input_resampler is not None:
@@ -429,29 +605,45 @@ class AudioCodec:
                     return
 
             # Apply AEC processing (only needed for macOS)
-            if (self._aec_enabled and len(audio_data) == AudioConfig.INPUT_FRAME_SIZE and self.aec_processor._is_macos):
+            if (self._aec_enabled and len(audio_data) == frame_size and self.aec_processor._is_macos):
                 try:
                     audio_data = self.aec_processor.process_audio(audio_data)
                 except Exception as e:
                     logger.warning(f"AEC processing failed, using raw audio: {e}")
 
-            # Real-time encoding and sending (not through queue, reduces latency)
+            # Real-time encoding and sending: hand the frame to the encode worker
+            encode_slots = self._encode_slots
             if (
-                self._encoded_audio_callback
-                and len(audio_data) == AudioConfig.INPUT_FRAME_SIZE
+                encoded_audio_callback
+                and encode_slots is not None
+                and len(audio_data) == frame_size
             ):
-                try:
-                    pcm_data = audio_data.astype(np.int16).tobytes()
-                    encoded_data = self.opus_encoder.encode(
-                        pcm_data, AudioConfig.INPUT_FRAME_SIZE
-                    )
-                    if encoded_data:
-                        self._encoded_audio_callback(encoded_data)
-                except Exception as e:
-                    logger.warning(f"Real-time recording encoding failed: {e}")
+                head = self._encode_head
+                if head - self._encode_tail < len(encode_slots):
+                    np.copyto(encode_slots[head % len(encode_slots)], audio_data)
+                    self._encode_head = head + 1
+                    self._encode_event.set()
+                else:
+                    # Worker is behind, drop this frame
+                    self._encode_dropped += 1
+                    if self._encode_dropped % 50 == 1:
+                        logger.warning(
+                            f"Encode queue full, dropped {self._encode_dropped} frames so far"
+                        )
 
-            # Also provide to wake word detection (through queue)
-            self._put_audio_data_safe(self._wakeword_buffer, audio_data.copy())
+            # Also provide to wake word detection (through queue) as int16 PCM bytes
+            # Bounded deque append discards the oldest frame when full, no exception path
+            pcm_bytes = audio_data.tobytes()
+            self._wakeword_buffer.append(pcm_bytes)
+            vad_buffer = self._vad_buffer
+            if vad_buffer is not None:
+                vad_buffer.append(pcm_bytes)  # bytes are immutable, both queues share one object
+                if self._vad_waiting and self._loop is not None:
+                    self._vad_waiting = False
+                    self._loop.call_soon_threadsafe(self._vad_event.set)
+            if self._wakeword_waiting and self._loop is not None:
+                self._wakeword_waiting = False
+                self._loop.call_soon_threadsafe(self._wakeword_event.set)
 
         except Exception as e:
             logger.error(f"Input callback error: {e}")
@@ -462,43 +654,39 @@ class AudioCodec:
         """
         try:
             resampled_data = self.input_resampler.resample_chunk(audio_data, last=False)
+            # ResampleStream is created with dtype int16, so no astype() copy is needed
+            ring = self._resample_input_buffer
+            expected_frame_size = AudioConfig.INPUT_FRAME_SIZE
+
+            generation = self._resample_clear_generation
+            if generation != self._input_resample_generation:
+                self._input_resample_generation = generation
+                ring.clear()
+
+            # Steady state: the resampler yields exactly one frame and nothing is pending,
+            # so hand its output on directly and skip the ring
+            if len(resampled_data) == expected_frame_size and len(ring) == 0:
+                return resampled_data
+
             if len(resampled_data) > 0:
-                self._resample_input_buffer.extend(resampled_data.astype(np.int16))
+                ring.write(resampled_data)
 
-            expected_frame_size = AudioConfig.INPUT_FRAME_SIZE
-            if len(self._resample_input_buffer) < expected_frame_size:
+            if len(ring) < expected_frame_size:
                 return None
 
-            frame_data = []
-            for _ in range(expected_frame_size):
-                frame_data.append(self._resample_input_buffer.popleft())
-
-            return np.array(frame_data, dtype=np.int16)
+            # Zero-copy view into the ring, only valid for the rest of this callback
+            return ring.read(expected_frame_size)
 
         except Exception as e:
             logger.error(f"Input resampling failed: {e}")
             return None
 
-    def _put_audio_data_safe(self, queue, audio_data):
-        """
-        Safe enqueue, discard oldest data when queue is full.
-        """
-        try:
-            queue.put_nowait(audio_data)
-        except asyncio.QueueFull:
-            try:
-                queue.get_nowait()
-                queue.put_nowait(audio_data)
-            except asyncio.QueueEmpty:
-                queue.put_nowait(audio_data)
-
     def _output_callback(self, outdata: np.ndarray, frames: int, time_info, status):
         """
         Playback callback, called by hardware driver. Get data from playback queue and output to speaker.
         """
-        if status:
-            if "underflow" not in str(status).lower():
-                logger.warning(f"Output stream status: {status}")
+        if status and not status.output_underflow:
+            logger.warning(f"Output stream status: {status}")
 
         try:
             if self.output_resampler is not None:
@@ -506,68 +694,101 @@ class AudioCodec:
                 self._output_callback_with_resample(outdata, frames)
             else:
                 # Direct playback: 24kHz
-                self._output_callback_direct(outdata, frames)
+                self._output_direct(outdata, frames)
+
+            if self._drain_waiting and not self._output_buffer:
+                self._drain_waiting = False
+                self._loop.call_soon_threadsafe(self._output_drained.set)
 
         except Exception as e:
             logger.error(f"Output callback error: {e}")
-            outdata.fill(0)
+            self._write_silence(outdata)
 
-    def _output_callback_direct(self, outdata: np.ndarray, frames: int):
+    def _write_silence(self, outdata: np.ndarray):
         """
-        Direct playback of 24kHz data (when device supports 24kHz)
+        Fill the output block with silence (single place to tune underrun handling).
         """
-        try:
-            # Get audio data from playback queue
-            audio_data = self._output_buffer.get_nowait()
+        outdata.fill(0)
 
-            if len(audio_data) >= frames * AudioConfig.CHANNELS:
-                output_frames = audio_data[: frames * AudioConfig.CHANNELS]
-                outdata[:] = output_frames.reshape(-1, AudioConfig.CHANNELS)
-            else:
-                out_len = len(audio_data) // AudioConfig.CHANNELS
-                if out_len > 0:
-                    outdata[:out_len] = audio_data[: out_len * AudioConfig.CHANNELS].reshape(
-                        -1, AudioConfig.CHANNELS
-                    )
-                if out_len < frames:
-                    outdata[out_len:] = 0
+    def _output_callback_mono_direct(self, outdata: np.ndarray, frames: int):
+        """
+        Direct playback of 24kHz mono data, reads the ring straight into outdata's only column
+        """
+        ring = self._output_buffer
+        out = outdata[:, 0]
+        available = len(ring)
+
+        if available >= frames:
+            ring.read_into(out)
+        elif available > 0:
+            # Underflow: write what is buffered and pad the tail with silence
+            ring.read_into(out[:available])
+            out[available:] = 0
+        else:
+            # Output silence when no data
+            self._write_silence(outdata)
 
-        except asyncio.QueueEmpty:
+    def _output_callback_direct(self, outdata: np.ndarray, frames: int):
+        """
+        Direct playback of 24kHz data (when device supports 24kHz)
+        """
+        ring = self._output_buffer
+        flat = outdata.reshape(-1)
+        need = frames * AudioConfig.CHANNELS
+        available = len(ring)
+
+        if available >= need:
+            # Copy straight from the playback ring into outdata
+            ring.read_into(flat)
+        elif available > 0:
+            # Underflow: write what is buffered and pad the tail with silence
+            ring.read_into(flat[:available])
+            flat[available:].fill(0)
+        else:
             # Output silence when no data
-            outdata.fill(0)
+            self._write_silence(outdata)
 
     def _output_callback_with_resample(self, outdata: np.ndarray, frames: int):
         """
         Resampled playback (24kHz -> Device sample rate)
         """
+        # Hoist hot attribute lookups to locals (callback runs every frame)
+        ring = self._resample_output_buffer
+        playback = self._output_buffer
+        scratch = self._output_resample_scratch
+        resample_chunk = self.output_resampler.resample_chunk
+        need = frames * AudioConfig.CHANNELS
+
         try:
+            generation = self._resample_clear_generation
+            if generation != self._output_resample_generation:
+                self._output_resample_generation = generation
+                ring.clear()
+
             # Continuously process 24kHz data for resampling
-            while len(self._resample_output_buffer) < frames * AudioConfig.CHANNELS:
-                try:
-                    audio_data = self._output_buffer.get_nowait()
-                    # 24kHz -> Device sample rate resampling
-                    resampled_data = self.output_resampler.resample_chunk(
-                        audio_data, last=False
-                    )
-                    if len(resampled_data) > 0:
-                        self._resample_output_buffer.extend(
-                            resampled_data.astype(np.int16)
-                        )
-                except asyncio.QueueEmpty:
+            while len(ring) < need:
+                available = len(playback)
+                if available == 0:
                     break
-
-            need = frames * AudioConfig.CHANNELS
-            if len(self._resample_output_buffer) >= need:
-                frame_data = [self._resample_output_buffer.popleft() for _ in range(need)]
-                output_array = np.array(frame_data, dtype=np.int16)
-                outdata[:] = output_array.reshape(-1, AudioConfig.CHANNELS)
+                # Copy out of the shared ring before resampling, the decoder may refill it.
+                # With a backlog, several frames go through one resample call to amortize its overhead
+                chunk = scratch[: min(available, len(scratch))]
+                chunk = chunk[: playback.read_into(chunk)]
+                # 24kHz -> Device sample rate resampling
+                resampled_data = resample_chunk(chunk, last=False)
+                # ResampleStream is created with dtype="int16", so no astype() copy is needed
+                if len(resampled_data) > 0:
+                    ring.write(resampled_data)
+
+            if len(ring) >= need:
+                ring.read_into(outdata.reshape(-1))
             else:
                 # Output silence when data is insufficient
-                outdata.fill(0)
+                self._write_silence(outdata)
 
         except Exception as e:
             logger.warning(f"Resampled output failed: {e}")
-            outdata.fill(0)
+            self._write_silence(outdata)
 
     def _input_finished_callback(self):
         """
@@ -575,12 +796,6 @@ class AudioCodec:
         """
         logger.info("Input stream ended")
 
-    def _reference_finished_callback(self):
-        """
-        Reference signal stream finished.
-        """
-        logger.info("Reference signal stream ended")
-
     def _output_finished_callback(self):
         """
         Output stream finished.
@@ -652,29 +867,75 @@ class AudioCodec:
             else:
                 raise
 
-    async def get_raw_audio_for_detection(self) -> Optional[bytes]:
+    async def get_raw_audio_for_detection(self, wait: bool = False) -> Optional[bytes]:
         """
         Get wake word audio data.
+
+        Args:
+            wait: Block until the input callback delivers a frame instead of returning None
         """
         try:
-            if self._wakeword_buffer.empty():
-                return None
-
-            audio_data = self._wakeword_buffer.get_nowait()
+            if wait:
+                while not self._wakeword_buffer:
+                    self._wakeword_event.clear()
+                    self._wakeword_waiting = True
+                    # Re-check after publishing the flag so a frame appended in between is not missed
+                    if self._wakeword_buffer:
+                        break
+                    await self._wakeword_event.wait()
+                self._wakeword_waiting = False
 
-            if hasattr(audio_data, "tobytes"):
-                return audio_data.tobytes()
-            elif hasattr(audio_data, "astype"):
-                return audio_data.astype("int16").tobytes()
-            else:
-                return audio_data
+            # Queue items are already int16 PCM bytes
+            return self._wakeword_buffer.popleft()
 
-        except asyncio.QueueEmpty:
+        except IndexError:
             return None
         except Exception as e:
             logger.error(f"Failed to get wake word audio data: {e}")
             return None
 
+    def attach_vad_tap(self):
+        """
+        Start mirroring input frames to the VAD queue.
+        """
+        if self._vad_buffer is None:
+            self._vad_buffer = deque(maxlen=100)
+
+    def detach_vad_tap(self):
+        """
+        Stop mirroring input frames to the VAD queue.
+        """
+        self._vad_buffer = None
+
+    async def get_raw_audio_for_vad(self, wait: bool = False) -> Optional[bytes]:
+        """
+        Get one 16kHz int16 PCM frame for VAD, None if nothing is queued or no tap is attached.
+
+        Args:
+            wait: Block until the input callback delivers a frame instead of returning None
+        """
+        vad_buffer = self._vad_buffer
+        if vad_buffer is None:
+            return None
+        try:
+            if wait:
+                while not vad_buffer:
+                    self._vad_event.clear()
+                    self._vad_waiting = True
+                    # Re-check after publishing the flag so a frame appended in between is not missed
+                    if vad_buffer:
+                        break
+                    await self._vad_event.wait()
+                self._vad_waiting = False
+
+            return vad_buffer.popleft()
+
+        except IndexError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get VAD audio data: {e}")
+            return None
+
     def set_encoded_audio_callback(self, callback):
         """
         Set encoding callback.
@@ -734,22 +995,33 @@ class AudioCodec:
         Decode audio and play. Network received Opus data -> Decode to 24kHz -> Playback queue.
         """
         try:
-            # Opus decode to 24kHz PCM data
-            pcm_data = self.opus_decoder.decode(
-                opus_data, AudioConfig.OUTPUT_FRAME_SIZE
+            # Opus decode to 24kHz int16 PCM: the playback ring, the resampler and the output stream
+            # are all int16, so the decoded bytes reach the device without a format conversion.
+            # Decoding runs on the decode worker, the ring write stays on the event loop
+            generation = self._output_generation
+            pcm_data = await asyncio.get_running_loop().run_in_executor(
+                self._decode_exec,
+                self.opus_decoder.decode,
+                opus_data,
+                AudioConfig.OUTPUT_FRAME_SIZE,
             )
 
             audio_array = np.frombuffer(pcm_data, dtype=np.int16)
 
-            expected_length = AudioConfig.OUTPUT_FRAME_SIZE * AudioConfig.CHANNELS
+            expected_length = self._EXPECTED_DECODE_LEN
             if len(audio_array) != expected_length:
                 logger.warning(
                     f"Decoded audio length abnormal: {len(audio_array)}, expected: {expected_length}"
                 )
                 return
 
-            # Put into playback queue
-            self._put_audio_data_safe(self._output_buffer, audio_array)
+            # Playback was cleared while this frame was decoding
+            if generation != self._output_generation:
+                return
+
+            # Write into playback ring
+            if self._output_buffer.write(audio_array) < expected_length:
+                logger.warning("Playback buffer full, discarding part of this frame")
 
         except opuslib.OpusError as e:
             logger.warning(f"Opus decoding failed, discarding this frame: {e}")
@@ -760,15 +1032,21 @@ class AudioCodec:
         """
         Wait for playback to complete.
         """
-        start = time.time()
-
-        while not self._output_buffer.empty() and time.time() - start < timeout:
-            await asyncio.sleep(0.05)
+        if self._output_buffer and self._loop is not None:
+            self._output_drained.clear()
+            self._drain_waiting = True
+            # Re-check after publishing the flag so a drain in between is not missed
+            if self._output_buffer:
+                try:
+                    await asyncio.wait_for(self._output_drained.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            self._drain_waiting = False
 
         await asyncio.sleep(0.3)
 
-        if not self._output_buffer.empty():
-            output_remaining = self._output_buffer.qsize()
+        if self._output_buffer:
+            output_remaining = len(self._output_buffer) // AudioConfig.OUTPUT_FRAME_SIZE
             logger.warning(f"Audio playback timeout, remaining queue - output: {output_remaining} frames")
 
     async def clear_audio_queue(self):
@@ -777,34 +1055,35 @@ class AudioCodec:
         """
         cleared_count = 0
 
-        queues_to_clear = [
-            self._wakeword_buffer,
-            self._output_buffer,
-        ]
+        cleared_count += len(self._wakeword_buffer)
+        self._wakeword_buffer.clear()
 
-        for queue in queues_to_clear:
-            while not queue.empty():
-                try:
-                    queue.get_nowait()
-                    cleared_count += 1
-                except asyncio.QueueEmpty:
-                    break
+        vad_buffer = self._vad_buffer
+        if vad_buffer is not None:
+            cleared_count += len(vad_buffer)
+            vad_buffer.clear()
 
-        if self._resample_input_buffer:
-            cleared_count += len(self._resample_input_buffer)
-            self._resample_input_buffer.clear()
+        self._output_generation += 1
+        cleared_count += len(self._output_buffer) // AudioConfig.OUTPUT_FRAME_SIZE
+        self._output_buffer.clear()
 
+        # Resample rings are cleared by their own callbacks on the next block
+        self._resample_clear_generation += 1
+        if self._resample_input_buffer:
+            cleared_count += len(self._resample_input_buffer) // (
+                AudioConfig.INPUT_FRAME_SIZE * AudioConfig.CHANNELS
+            )
         if self._resample_output_buffer:
-            cleared_count += len(self._resample_output_buffer)
-            self._resample_output_buffer.clear()
+            device_output_frame_size = int(
+                self.device_output_sample_rate * (AudioConfig.FRAME_DURATION / 1000)
+            )
+            cleared_count += len(self._resample_output_buffer) // (
+                device_output_frame_size * AudioConfig.CHANNELS
+            )
 
         if cleared_count > 0:
             logger.info(f"Cleared audio queues, discarded {cleared_count} frames of audio data")
 
-        if cleared_count > 100:
-            gc.collect()
-            logger.debug("Executed garbage collection to free memory")
-
     async def start_streams(self):
         """
         Start audio streams.
@@ -851,7 +1130,7 @@ class AudioCodec:
         if resampler:
             try:
                 if hasattr(resampler, "resample_chunk"):
-                    empty_array = np.array([], dtype=np.int16)
+                    empty_array = np.empty(0, dtype=np.int16)
                     resampler.resample_chunk(empty_array, last=True)
             except Exception as e:
                 logger.warning(f"Failed to clean up {name} resampler: {e}")
@@ -892,8 +1171,24 @@ class AudioCodec:
             self.input_resampler = None
             self.output_resampler = None
 
-            self._resample_input_buffer.clear()
-            self._resample_output_buffer.clear()
+            self._resample_input_buffer = None
+            self._resample_output_buffer = None
+
+            # Cancel pending AEC bring-up
+            if self._aec_task and not self._aec_task.done():
+                self._aec_task.cancel()
+                try:
+                    await self._aec_task
+                except (asyncio.CancelledError, Exception):
+                    pass
+            self._aec_task = None
+            self._aec_enabled = False
+
+            self._stop_encode_worker()
+
+            if self._decode_exec:
+                self._decode_exec.shutdown(wait=False)
+                self._decode_exec = None
 
             # Close AEC processor
             if self.aec_processor:
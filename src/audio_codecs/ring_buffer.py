@@ -0,0 +1,111 @@
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity sample ring buffer backed by a preallocated numpy array.
+
+    Positions are monotonic counters: the producer only advances the write position and the
+    consumer only advances the read position, so one producer thread and one consumer thread
+    can share the ring without locks.
+    With overwrite=True (producer and consumer on the same thread) a full ring drops its oldest
+    samples; with overwrite=False the incoming samples that do not fit are dropped instead.
+    """
+
+    def __init__(self, capacity: int, dtype=np.int16, overwrite: bool = True):
+        self._buffer = np.zeros(capacity, dtype=dtype)
+        self._capacity = capacity
+        self._overwrite = overwrite
+        self._write_pos = 0  # Owned by the producer
+        self._read_pos = 0  # Owned by the consumer
+        self._clear_pos = 0  # Set by clear() on the producer side, applied by the consumer
+
+    def __len__(self) -> int:
+        # A clear() racing this read can put _clear_pos past the _write_pos read above it
+        return max(0, self._write_pos - max(self._read_pos, self._clear_pos))
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def write(self, data: np.ndarray) -> int:
+        """
+        Append samples, returns the number of samples actually stored.
+        """
+        n = len(data)
+        if n == 0:
+            return 0
+        cap = self._capacity
+        free = cap - len(self)
+        if n > free:
+            if not self._overwrite:
+                n = free
+                if n == 0:
+                    return 0
+                data = data[:n]
+            elif n >= cap:
+                # Only the newest `cap` samples survive
+                data = data[n - cap :]
+                n = cap
+                self._read_pos = self._write_pos
+            else:
+                self._read_pos = max(self._read_pos, self._clear_pos) + (n - free)
+
+        tail = self._write_pos % cap
+        first = min(n, cap - tail)
+        self._buffer[tail : tail + first] = data[:first]
+        if first < n:
+            self._buffer[: n - first] = data[first:]
+        self._write_pos += n
+        return n
+
+    def _start_read(self) -> int:
+        read = self._read_pos
+        if self._clear_pos > read:
+            read = self._clear_pos
+        return read
+
+    def read(self, n: int) -> np.ndarray:
+        """
+        Pop `n` samples (caller must check len() first).
+        Returns a view into the ring when the samples are contiguous; the view is only
+        valid until the next write, so cross-thread consumers should use read_into().
+        A copy is made only when the read wraps around.
+        Fewer samples are returned if a concurrent clear() dropped them after the len() check.
+        """
+        read = self._start_read()
+        n = min(n, self._write_pos - read)
+        head = read % self._capacity
+        if head + n <= self._capacity:
+            self._read_pos = read + n
+            return self._buffer[head : head + n]
+        out = np.empty(n, dtype=self._buffer.dtype)
+        self.read_into(out)
+        return out
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Pop len(out) samples directly into `out` (caller must check len() first).
+        If a concurrent clear() dropped samples after the len() check, the missing tail is
+        zero-filled so the read position never passes the write position; returns the
+        number of samples actually read.
+        """
+        n = len(out)
+        read = self._start_read()
+        available = self._write_pos - read
+        if n > available:
+            out[available:] = 0
+            n = available
+        head = read % self._capacity
+        first = min(n, self._capacity - head)
+        np.copyto(out[:first], self._buffer[head : head + first])
+        if first < n:
+            np.copyto(out[first:], self._buffer[: n - first])
+        self._read_pos = read + n
+        return n
+
+    def clear(self):
+        """
+        Drop all buffered samples (producer side; the consumer skips ahead on its next read).
+        """
+        self._clear_pos = self._write_pos
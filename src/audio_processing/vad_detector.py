@@ -1,22 +1,68 @@
+import asyncio
 import logging
-import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-import pyaudio
-import webrtcvad
+import sherpa_onnx
 
-from src.constants.constants import AbortReason, DeviceState
+from src.audio_codecs.ring_buffer import AudioRingBuffer
+from src.constants.constants import AbortReason, AudioConfig, DeviceState
+from src.utils.resource_finder import resource_finder
+
+# Fallback VAD backend, used when the Silero model is not provisioned
+try:
+    import webrtcvad
+
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
+# Optional JIT for the per-window energy reduction
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Configure logging
 logger = logging.getLogger("VADDetector")
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _abs_sum(audio_data):
+        """
+        Sum of absolute int16 samples in one fused loop (widened to int64, -32768 safe).
+        """
+        total = 0
+        for x in audio_data:
+            v = np.int64(x)
+            total += v if v >= 0 else -v
+        return total
+
+else:
+
+    def _abs_sum(audio_data):
+        """
+        Sum of absolute int16 samples (abs computed at int32 width, -32768 safe).
+        """
+        return int(np.abs(audio_data, dtype=np.int32).sum())
+
+
 class VADDetector:
     """
-    WebRTC VAD-based voice activity detector for detecting user interruptions.
+    Voice activity detector for detecting user interruptions.
+
+    Uses Silero VAD (models/silero_vad.onnx, run by sherpa-onnx) when the model is present
+    and falls back to WebRTC VAD otherwise.
     """
 
+    SILERO_MODEL = "models/silero_vad.onnx"
+    SILERO_WINDOW = 512  # Silero VAD window: 512 samples (32ms) at 16kHz
+    WEBRTC_FRAME_MS = 20  # WebRTC VAD accepts 10/20/30ms frames
+
     def __init__(self, audio_codec, protocol, app_instance, loop):
         """Initialize VAD detector.
 
@@ -31,46 +77,70 @@ class VADDetector:
         self.app = app_instance
         self.loop = loop
 
-        # VAD settings
-        self.vad = webrtcvad.Vad()
-        self.vad.set_mode(3)  # Set highest sensitivity
-
         # Parameter settings
         self.sample_rate = 16000
-        self.frame_duration = 20  # milliseconds
-        self.frame_size = int(self.sample_rate * self.frame_duration / 1000)
-        self.speech_window = 5  # How many consecutive speech frames to trigger interruption
+        self.speech_trigger_ms = 100  # Continuous speech needed to trigger interruption
+        self.speech_threshold = 0.5  # Silero speech probability threshold
         self.energy_threshold = 300  # Energy threshold
 
+        # VAD settings: backend decides the window size and the per-window classifier
+        self.backend = None
+        self.vad = self._create_silero_vad()
+        if self.vad is not None:
+            self.backend = "silero"
+            self.frame_size = self.SILERO_WINDOW
+            self._classify = self._classify_silero
+        else:
+            self.vad = self._create_webrtc_vad()
+            if self.vad is not None:
+                self.backend = "webrtc"
+            self.frame_size = self.sample_rate * self.WEBRTC_FRAME_MS // 1000
+            self._classify = self._classify_webrtc
+        self.frame_duration = self.frame_size * 1000 // self.sample_rate  # milliseconds
+        # How many consecutive speech frames to trigger interruption
+        self.speech_window = max(1, round(self.speech_trigger_ms / self.frame_duration))
+
+        # Codec frames (INPUT_FRAME_SIZE samples) are regrouped into VAD windows, each window
+        # is classified as soon as it is complete
+        self._pending = AudioRingBuffer(AudioConfig.INPUT_FRAME_SIZE + self.frame_size)
+        # Preallocated int16 window and its float32 conversion
+        self._window = np.empty(self.frame_size, dtype=np.int16)
+        self._samples = np.empty(self.frame_size, dtype=np.float32)
+        self._scale = np.float32(1.0 / 32768.0)
+
         # State variables
         self.running = False
         self.paused = False
-        self.thread = None
+        # Set while detection may run; the loop parks on it while paused instead of polling
+        self._resume_evt = asyncio.Event()
+        self._resume_evt.set()
+        self.task = None
+        # Single worker running VAD inference off the event loop, created in start()
+        self._vad_exec = None
         self.speech_count = 0
         self.silence_count = 0
         self.triggered = False
 
-        # Create independent PyAudio instance and stream to avoid conflicts with main audio stream
-        self.pa = None
-        self.stream = None
-
     def start(self):
         """
         Start VAD detector.
         """
-        if self.thread and self.thread.is_alive():
+        if self.task and not self.task.done():
             logger.warning("VAD detector is already running")
             return
 
         self.running = True
         self.paused = False
+        self._set_resume_event()
+
+        if self._vad_exec is None:
+            self._vad_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vad")
 
-        # Initialize PyAudio and stream
-        self._initialize_audio_stream()
+        # Reuse the codec's 16kHz input instead of opening a second capture stream
+        self.audio_codec.attach_vad_tap()
 
-        # Start detection thread
-        self.thread = threading.Thread(target=self._detection_loop, daemon=True)
-        self.thread.start()
+        # Run detection on the application's event loop (start() may be called from any thread)
+        self.task = asyncio.run_coroutine_threadsafe(self._detection_loop(), self.loop)
         logger.info("VAD detector started")
 
     def stop(self):
@@ -79,11 +149,16 @@ class VADDetector:
         """
         self.running = False
 
-        # Close audio stream
-        self._close_audio_stream()
+        self.audio_codec.detach_vad_tap()
 
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=1.0)
+        if self.task and not self.task.done():
+            self.task.cancel()
+        self.task = None
+
+        # Wait for an in-flight inference before the detector state can be released
+        if self._vad_exec is not None:
+            self._vad_exec.shutdown(wait=True)
+            self._vad_exec = None
 
         logger.info("VAD detector stopped")
 
@@ -92,6 +167,7 @@ class VADDetector:
         Pause VAD detection.
         """
         self.paused = True
+        self._resume_evt.clear()
         logger.info("VAD detector paused")
 
     def resume(self):
@@ -103,147 +179,170 @@ class VADDetector:
         self.speech_count = 0
         self.silence_count = 0
         self.triggered = False
+        # Buffer and model state are owned by the loop and the inference worker, reset them there
+        self.loop.call_soon_threadsafe(self._on_resume)
         logger.info("VAD detector resumed")
 
+    def _on_resume(self):
+        """
+        Drop buffered audio and model state, then wake the detection loop (runs on the loop).
+        """
+        self._pending.clear()
+        if self.backend == "silero":
+            if self._vad_exec is not None:
+                # Queued behind any in-flight inference on the single worker
+                self._vad_exec.submit(self.vad.reset)
+            else:
+                self.vad.reset()
+        self._resume_evt.set()
+
+    def _set_resume_event(self):
+        """
+        Wake the detection loop (asyncio.Event is not thread-safe, so set it on the loop).
+        """
+        self.loop.call_soon_threadsafe(self._resume_evt.set)
+
     def is_running(self):
         """
         Check if VAD detector is running.
         """
         return self.running and not self.paused
 
-    def _initialize_audio_stream(self):
+    def _create_silero_vad(self):
         """
-        Initialize independent audio stream.
+        Create Silero VAD from models/silero_vad.onnx, None if the model is not provisioned.
         """
         try:
-            # Create PyAudio instance
-            self.pa = pyaudio.PyAudio()
-
-            # Get default input device
-            device_index = None
-            for i in range(self.pa.get_device_count()):
-                device_info = self.pa.get_device_info_by_index(i)
-                if device_info["maxInputChannels"] > 0:
-                    device_index = i
-                    break
-
-            if device_index is None:
-                logger.error("No available input device found")
-                return False
-
-            # Create input stream
-            self.stream = self.pa.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=self.sample_rate,
-                input=True,
-                input_device_index=device_index,
-                frames_per_buffer=self.frame_size,
-                start=True,
-            )
+            model_path = resource_finder.find_file(self.SILERO_MODEL)
+            if model_path is None:
+                logger.warning(
+                    f"Silero VAD model not found: {self.SILERO_MODEL}, "
+                    "falling back to WebRTC VAD"
+                )
+                return None
 
-            logger.info(f"VAD detector audio stream initialized, using device index: {device_index}")
-            return True
+            config = sherpa_onnx.VadModelConfig()
+            config.silero_vad.model = str(model_path)
+            config.silero_vad.threshold = self.speech_threshold
+            config.silero_vad.window_size = self.SILERO_WINDOW
+            config.sample_rate = self.sample_rate
+            config.num_threads = 1
+            config.provider = "cpu"
 
+            return sherpa_onnx.VoiceActivityDetector(config, buffer_size_in_seconds=5)
         except Exception as e:
-            logger.error(f"Failed to initialize VAD audio stream: {e}")
-            return False
+            logger.error(f"Failed to create Silero VAD: {e}")
+            return None
 
-    def _close_audio_stream(self):
+    def _create_webrtc_vad(self):
         """
-        Close audio stream.
+        Create WebRTC VAD, None if webrtcvad is not installed.
         """
-        try:
-            if self.stream:
-                self.stream.stop_stream()
-                self.stream.close()
-                self.stream = None
-
-            if self.pa:
-                self.pa.terminate()
-                self.pa = None
-
-            logger.info("VAD detector audio stream closed")
-        except Exception as e:
-            logger.error(f"Failed to close VAD audio stream: {e}")
+        if not WEBRTCVAD_AVAILABLE:
+            logger.error("No VAD backend available: Silero model missing and webrtcvad not installed")
+            return None
+        vad = webrtcvad.Vad()
+        vad.set_mode(3)  # Set highest sensitivity
+        return vad
 
-    def _detection_loop(self):
+    async def _detection_loop(self):
         """
         VAD detection main loop.
         """
         logger.info("VAD detection loop started")
 
+        # Loop-invariant bindings for the per-frame path
+        codec = self.audio_codec
+        loop = self.loop
+        vad_exec = self._vad_exec
+        pending = self._pending
+        window = self._window
+        size = self.frame_size
+        detect_speech = self._detect_speech
+
+        if not self.vad:
+            logger.error("VAD not initialized, VAD detection loop not started")
+            return
+
         while self.running:
-            # Skip if paused or audio stream not initialized
-            if self.paused or not self.stream:
-                time.sleep(0.1)
+            # Park until resumed
+            if self.paused:
+                await self._resume_evt.wait()
                 continue
 
             try:
+                # Parks until the input callback delivers a frame
+                frame = await codec.get_raw_audio_for_vad(wait=True)
+                if frame is None:
+                    # Tap detached, the detector is being stopped
+                    break
+
                 # Only detect during speaking state
-                if self.app.device_state == DeviceState.SPEAKING:
-                    # Read audio frame
-                    frame = self._read_audio_frame()
-                    if not frame:
-                        time.sleep(0.01)
-                        continue
+                if self.app.device_state != DeviceState.SPEAKING:
+                    # Not in speaking state, reset state
+                    self._reset_state()
+                    continue
+
+                pending.write(np.frombuffer(frame, dtype=np.int16))
+
+                # Classify every complete window as soon as it is buffered, so speech onset
+                # is seen without waiting for further frames
+                while not self.paused and len(pending) >= size:
+                    pending.read_into(window)
 
-                    # Detect if it's speech
-                    is_speech = self._detect_speech(frame)
+                    # Detect if it's speech (VAD inference runs on the worker thread)
+                    is_speech = await loop.run_in_executor(vad_exec, detect_speech, window)
 
                     # If speech detected and trigger condition met, handle interruption
                     if is_speech:
-                        self._handle_speech_frame(frame)
+                        self._handle_speech_frame(window)
                     else:
-                        self._handle_silence_frame(frame)
-                else:
-                    # Not in speaking state, reset state
-                    self._reset_state()
+                        self._handle_silence_frame(window)
 
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 logger.error(f"VAD detection loop error: {e}")
 
-            time.sleep(0.01)  # Small delay to reduce CPU usage
-
         logger.info("VAD detection loop ended")
 
-    def _read_audio_frame(self):
+    def _classify_silero(self, audio_data):
         """
-        Read one frame of audio data.
+        Silero VAD decision for one 32ms window.
         """
-        try:
-            if not self.stream or not self.stream.is_active():
-                return None
-
-            # Read audio data
-            data = self.stream.read(self.frame_size, exception_on_overflow=False)
-            return data
-        except Exception as e:
-            logger.error(f"Failed to read audio frame: {e}")
-            return None
+        vad = self.vad
+        np.multiply(audio_data, self._scale, out=self._samples)
+        vad.accept_waveform(self._samples)
+        is_speech = vad.is_speech_detected()
+        # Only the per-window decision is used, drop finished speech segments
+        while not vad.empty():
+            vad.pop()
+        return is_speech
+
+    def _classify_webrtc(self, audio_data):
+        """
+        WebRTC VAD decision for one 20ms frame.
+        """
+        return self.vad.is_speech(audio_data.tobytes(), self.sample_rate)
 
-    def _detect_speech(self, frame):
+    def _detect_speech(self, audio_data):
         """
-        Detect if it's speech.
+        Detect if one window is speech.
         """
         try:
-            # Ensure frame length is correct
-            if len(frame) != self.frame_size * 2:  # 16-bit audio, 2 bytes per sample
-                return False
-
-            # Use VAD detection
-            is_speech = self.vad.is_speech(frame, self.sample_rate)
+            is_speech = self._classify(audio_data)
 
-            # Calculate audio energy
-            audio_data = np.frombuffer(frame, dtype=np.int16)
-            energy = np.mean(np.abs(audio_data))
+            # Audio energy (mean absolute amplitude) compared as an integer sum against
+            # threshold * window, so no division or float mean is needed per window
+            total = _abs_sum(audio_data)
 
             # Combine VAD and energy threshold
-            is_valid_speech = is_speech and energy > self.energy_threshold
+            is_valid_speech = is_speech and total > self.energy_threshold * self.frame_size
 
             if is_valid_speech:
                 logger.debug(
-                    f"Speech detected [energy: {energy:.2f}] [consecutive speech frames: {self.speech_count+1}]"
+                    f"Speech detected [energy: {total / self.frame_size:.2f}] "
+                    f"[consecutive speech frames: {self.speech_count+1}]"
                 )
 
             return is_valid_speech
@@ -260,18 +359,17 @@ class VADDetector:
 
         # Detect enough consecutive speech frames, trigger interruption
         if self.speech_count >= self.speech_window and not self.triggered:
+            # Pause and latch the trigger before notifying, so exactly one interruption is
+            # scheduled per speech episode; resume() clears both
             self.triggered = True
+            self.paused = True
+            self._resume_evt.clear()
             logger.info("Continuous speech detected, triggering interruption!")
             self._trigger_interrupt()
-
-            # Immediately pause itself to prevent repeated triggering
-            self.paused = True
             logger.info("VAD detector automatically paused to prevent repeated triggering")
 
-            # Reset state
             self.speech_count = 0
             self.silence_count = 0
-            self.triggered = False
 
     def _handle_silence_frame(self, frame):
         """
@@ -287,6 +385,7 @@ class VADDetector:
         self.speech_count = 0
         self.silence_count = 0
         self.triggered = False
+        self._pending.clear()
 
     def _trigger_interrupt(self):
         """
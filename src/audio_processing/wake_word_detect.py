@@ -1,5 +1,6 @@
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -21,7 +22,12 @@ class WakeWordDetector:
         self.audio_codec = None
         self.is_running_flag = False
         self.paused = False
+        # Set while detection may run; the loop parks on it while paused instead of polling
+        self._resume_evt = asyncio.Event()
+        self._resume_evt.set()
         self.detection_task = None
+        # Single worker thread for the blocking KeywordSpotter calls, created in start()
+        self._kws_exec = None
 
         # Anti-repeat trigger mechanism - shorten cooldown time for better response
         self.last_detection_time = 0
@@ -46,6 +52,14 @@ class WakeWordDetector:
         self.keyword_spotter = None
         self.stream = None
 
+        # Preallocated contiguous float32 scratch for batched frames (int16 -> float32 in one ufunc pass)
+        self.max_batch_frames = 3
+        self._frame_samples = AudioConfig.INPUT_FRAME_SIZE  # Samples per codec frame (mono)
+        self._pcm_scratch = np.empty(
+            self.max_batch_frames * self._frame_samples, dtype=np.float32
+        )
+        self._scale = np.float32(1.0 / 32768.0)
+
         # Initialize configuration
         self._load_config(config)
         self._init_kws_model()
@@ -88,15 +102,24 @@ class WakeWordDetector:
             f"KWS configuration loaded - threshold: {self.keywords_threshold}, score: {self.keywords_score}"
         )
 
+    def _find_model_file(self, name: str) -> Path:
+        """
+        Prefer the int8 quantized model file, falling back to FP32.
+        """
+        int8_path = self.model_dir / f"{name}.int8.onnx"
+        if int8_path.exists():
+            return int8_path
+        return self.model_dir / f"{name}.onnx"
+
     def _init_kws_model(self):
         """
         Initialize Sherpa-ONNX KeywordSpotter model.
         """
         try:
-            # Check model files
-            encoder_path = self.model_dir / "encoder.onnx"
-            decoder_path = self.model_dir / "decoder.onnx"
-            joiner_path = self.model_dir / "joiner.onnx"
+            # Check model files (int8 quantized variants are preferred when present)
+            encoder_path = self._find_model_file("encoder")
+            decoder_path = self._find_model_file("decoder")
+            joiner_path = self._find_model_file("joiner")
             tokens_path = self.model_dir / "tokens.txt"
             keywords_path = self.model_dir / "keywords.txt"
 
@@ -111,7 +134,10 @@ class WakeWordDetector:
                 if not file_path.exists():
                     raise FileNotFoundError(f"Model file does not exist: {file_path}")
 
-            logger.info(f"Loading Sherpa-ONNX KeywordSpotter model: {self.model_dir}")
+            logger.info(
+                f"Loading Sherpa-ONNX KeywordSpotter model: {self.model_dir} "
+                f"(encoder: {encoder_path.name})"
+            )
 
             # Create KeywordSpotter
             self.keyword_spotter = sherpa_onnx.KeywordSpotter(
@@ -131,11 +157,28 @@ class WakeWordDetector:
             )
 
             logger.info("Sherpa-ONNX KeywordSpotter model loaded successfully")
+            self._warm_up()
 
         except Exception as e:
             logger.error(f"Sherpa-ONNX KeywordSpotter initialization failed: {e}", exc_info=True)
             self.enabled = False
 
+    def _warm_up(self):
+        """
+        Run 100ms of silence through a throwaway stream so ONNX Runtime allocates its buffers
+        and thread pool before the first real frame.
+        """
+        try:
+            stream = self.keyword_spotter.create_stream()
+            stream.accept_waveform(
+                sample_rate=self.sample_rate,
+                waveform=np.zeros(self.sample_rate // 10, dtype=np.float32),
+            )
+            while self.keyword_spotter.is_ready(stream):
+                self.keyword_spotter.decode_stream(stream)
+        except Exception as e:
+            logger.debug(f"KWS warm-up skipped: {e}")
+
     def on_detected(self, callback: Callable):
         """
         Set callback function for detected wake word.
@@ -158,10 +201,17 @@ class WakeWordDetector:
             self.audio_codec = audio_codec
             self.is_running_flag = True
             self.paused = False
+            self._resume_evt.set()
 
             # Create detection stream
             self.stream = self.keyword_spotter.create_stream()
 
+            # Decoding runs off the event loop on a dedicated thread
+            if self._kws_exec is None:
+                self._kws_exec = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="kws"
+                )
+
             # Start detection task
             self.detection_task = asyncio.create_task(self._detection_loop())
 
@@ -182,18 +232,15 @@ class WakeWordDetector:
         while self.is_running_flag:
             try:
                 if self.paused:
-                    await asyncio.sleep(0.1)
+                    await self._resume_evt.wait()
                     continue
 
                 if not self.audio_codec:
                     await asyncio.sleep(0.5)
                     continue
 
-                # Process audio data
+                # Process audio data (waits for the codec to deliver a frame)
                 await self._process_audio()
-
-                # Reduce delay for better response speed
-                await asyncio.sleep(0.005)
                 error_count = 0
 
             except asyncio.CancelledError:
@@ -223,44 +270,56 @@ class WakeWordDetector:
             if not self.audio_codec or not self.stream:
                 return
 
-            # Batch get multiple audio frames for efficiency
-            audio_batches = []
-            for _ in range(3):  # Process up to 3 frames at once
-                data = await self.audio_codec.get_raw_audio_for_detection()
-                if data:
-                    audio_batches.append(data)
-
-            if not audio_batches:
+            # Wait for the first frame, then drain whatever else is already queued
+            data = await self.audio_codec.get_raw_audio_for_detection(wait=True)
+            if not data:
                 return
+            audio_batches = [data]
+            for _ in range(self.max_batch_frames - 1):  # Process up to 3 frames at once
+                data = await self.audio_codec.get_raw_audio_for_detection()
+                if not data:
+                    break
+                audio_batches.append(data)
 
-            # Batch process audio data
+            # Convert the batch back to back into the scratch buffer: each frame is a bounded
+            # zero-copy int16 view scaled straight into its float32 slot, no astype() temporary
+            frame_size = self._frame_samples
+            scratch = self._pcm_scratch
+            offset = 0
             for data in audio_batches:
-                # Convert audio format
-                if isinstance(data, bytes):
-                    samples = (
-                        np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
-                    )
-                else:
-                    samples = np.array(data, dtype=np.float32)
+                frame = np.frombuffer(data, dtype=np.int16, count=frame_size)
+                np.multiply(frame, self._scale, out=scratch[offset : offset + frame_size])
+                offset += frame_size
+            samples = scratch[:offset]
+
+            # Feed and decode the whole batch on the KWS thread (the scratch is not
+            # touched again until this returns)
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._kws_exec, self._decode_batch, samples
+            )
+            if result:
+                await self._handle_detection_result(result)
 
-                # Provide audio data to KeywordSpotter
-                self.stream.accept_waveform(
-                    sample_rate=self.sample_rate, waveform=samples
-                )
+        except Exception as e:
+            logger.debug(f"KWS audio processing error: {e}")
 
-            # Process detection results
-            while self.keyword_spotter.is_ready(self.stream):
-                self.keyword_spotter.decode_stream(self.stream)
-                result = self.keyword_spotter.get_result(self.stream)
+    def _decode_batch(self, samples: np.ndarray) -> Optional[str]:
+        """
+        Provide one batch to KeywordSpotter and decode it, runs on the KWS executor thread.
+        """
+        self.stream.accept_waveform(sample_rate=self.sample_rate, waveform=samples)
 
-                if result:
-                    await self._handle_detection_result(result)
-                    # Reset stream state
-                    self.keyword_spotter.reset_stream(self.stream)
-                    break  # Process immediately after detection, don't continue batch processing
+        # Process detection results
+        while self.keyword_spotter.is_ready(self.stream):
+            self.keyword_spotter.decode_stream(self.stream)
+            result = self.keyword_spotter.get_result(self.stream)
 
-        except Exception as e:
-            logger.debug(f"KWS audio processing error: {e}")
+            if result:
+                # Reset stream state
+                self.keyword_spotter.reset_stream(self.stream)
+                return result  # Process immediately after detection, don't continue batch processing
+
+        return None
 
     async def _handle_detection_result(self, result):
         """
@@ -296,6 +355,12 @@ class WakeWordDetector:
             except asyncio.CancelledError:
                 pass
 
+        if self._kws_exec:
+            # Cancelling the task does not stop a running _decode_batch, wait for it to finish
+            # so the KWS stream is not released while the worker still uses it
+            self._kws_exec.shutdown(wait=True)
+            self._kws_exec = None
+
         logger.info("Sherpa-ONNX KeywordSpotter detector stopped")
 
     async def pause(self):
@@ -303,6 +368,7 @@ class WakeWordDetector:
         Pause detection.
         """
         self.paused = True
+        self._resume_evt.clear()
         logger.debug("KWS detection paused")
 
     async def resume(self):
@@ -310,6 +376,7 @@ class WakeWordDetector:
         Resume detection.
         """
         self.paused = False
+        self._resume_evt.set()
         logger.debug("KWS detection resumed")
 
     def is_running(self) -> bool:
@@ -1,9 +1,20 @@
-import platform
+import functools
+import os
 
 from src.utils.config_manager import ConfigManager
 
 config = ConfigManager.get_instance()
 
+# Host architecture, probed once at import: os.uname() is a single syscall on POSIX, Windows
+# exposes the architecture in the environment (platform.machine() may spawn a subprocess there)
+_MACHINE = (
+    os.uname().machine
+    if hasattr(os, "uname")
+    else os.environ.get("PROCESSOR_ARCHITECTURE", "")
+).lower()
+# Machine type prefixes of ARM hosts (arm64, armv7l, armv6l, aarch64...)
+_ARM_PREFIXES = ("arm", "aarch")
+
 
 class ListeningMode:
     """
@@ -58,22 +69,25 @@ def is_official_server(ws_addr: str) -> bool:
     return "api.tenclass.net" in ws_addr
 
 
+# OTA server address, resolved once for AudioConfig and get_frame_duration
+_OTA_URL = config.get_config("SYSTEM_OPTIONS.NETWORK.OTA_VERSION_URL") or ""
+_IS_OFFICIAL = is_official_server(_OTA_URL)
+
+
+@functools.lru_cache(maxsize=1)
 def get_frame_duration() -> int:
-    """Get device frame duration.
+    """Get device frame duration (resolved once, the inputs do not change at runtime).
 
     Returns:
         int: Frame duration (milliseconds)
     """
     try:
         # Check if it's the official server
-        ota_url = config.get_config("SYSTEM_OPTIONS.NETWORK.OTA_VERSION_URL")
-        if not is_official_server(ota_url):
+        if not _IS_OFFICIAL:
             return 60
 
         # Detect ARM architecture devices (like Raspberry Pi)
-        machine = platform.machine().lower()
-        arm_archs = ["arm", "aarch64", "armv7l", "armv6l"]
-        is_arm_device = any(arch in machine for arch in arm_archs)
+        is_arm_device = _MACHINE.startswith(_ARM_PREFIXES)
 
         if is_arm_device:
             # ARM devices (like Raspberry Pi) use larger frame duration to reduce CPU load
@@ -95,8 +109,7 @@ class AudioConfig:
     # Fixed configuration
     INPUT_SAMPLE_RATE = 16000  # Input sample rate 16kHz
     # Output sample rate: official server uses 24kHz, others use 16kHz
-    _ota_url = config.get_config("SYSTEM_OPTIONS.NETWORK.OTA_VERSION_URL")
-    OUTPUT_SAMPLE_RATE = 24000 if is_official_server(_ota_url) else 16000
+    OUTPUT_SAMPLE_RATE = 24000 if _IS_OFFICIAL else 16000
     CHANNELS = 1
 
     # Dynamically get frame duration
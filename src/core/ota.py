@@ -1,6 +1,10 @@
 import asyncio
 import json
+import logging
+import os
 import socket
+import sys
+import time
 
 import aiohttp
 
@@ -9,10 +13,17 @@ from src.utils.config_manager import ConfigManager
 from src.utils.device_fingerprint import DeviceFingerprint
 from src.utils.logging_config import get_logger
 
+# Outbound interface IP, resolved once per process (only changes on network reconfiguration)
+_CACHED_LOCAL_IP = None
+
 
 class Ota:
     _instance = None
-    _lock = asyncio.Lock()
+    _init_task = None  # One-shot construction task shared by concurrent get_instance() callers
+
+    # Last successful OTA response is reused without a network round-trip for this long (seconds)
+    OTA_CACHE_TTL = 3600
+    OTA_CACHE_FILE = "ota_cache.json"
 
     def __init__(self):
         self.logger = get_logger(__name__)
@@ -20,18 +31,38 @@ class Ota:
         self.device_fingerprint = DeviceFingerprint.get_instance()
         self.mac_addr = None
         self.ota_version_url = None
+        self.activation_version = None  # Resolved once in init(), may be preset by the initializer
         self.local_ip = None
         self.system_info = None
+        self._session = None  # Shared aiohttp session, created in init()
+        self._refresh_task = None  # Background revalidation of a cached OTA response
+        # Called with the revalidated response when it differs from the cached one
+        self.on_refresh_changed = None
+        # Request headers/payload, prebuilt in init()
+        self._base_headers = None
+        self._v2_headers = None
+        self._payload = None
 
     @classmethod
     async def get_instance(cls):
-        if cls._instance is None:
-            async with cls._lock:
-                if cls._instance is None:
-                    instance = cls()
-                    await instance.init()
-                    cls._instance = instance
-        return cls._instance
+        if cls._instance is not None:
+            return cls._instance
+        # Created on the caller's running loop, unlike a class-level asyncio.Lock
+        if cls._init_task is None:
+            cls._init_task = asyncio.get_running_loop().create_task(cls._build())
+        try:
+            return await asyncio.shield(cls._init_task)
+        except Exception:
+            # Let the next caller retry after a failed initialization
+            cls._init_task = None
+            raise
+
+    @classmethod
+    async def _build(cls):
+        instance = cls()
+        await instance.init()
+        cls._instance = instance
+        return instance
 
     async def init(self):
         """
@@ -44,77 +75,162 @@ class Ota:
         self.ota_version_url = self.config.get_config(
             "SYSTEM_OPTIONS.NETWORK.OTA_VERSION_URL"
         )
+        self.activation_version = self.config.get_config(
+            "SYSTEM_OPTIONS.NETWORK.ACTIVATION_VERSION", "v1"
+        )
+        self._build_request_templates()
+        # One session (connector, SSL context, DNS cache) reused by every OTA request
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(
+                limit=4, ttl_dns_cache=300, keepalive_timeout=60
+            ),
+        )
+
+    async def close(self):
+        """
+        Close the shared HTTP session.
+        """
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @classmethod
+    async def close_instance(cls):
+        """
+        Close the shared instance's HTTP session and drop the singleton.
+        """
+        instance = cls._instance
+        cls._instance = None
+        cls._init_task = None
+        if instance is not None:
+            await instance.close()
+
+    @classmethod
+    def invalidate_local_ip(cls):
+        """
+        Forget the cached local IP (called when an OTA request fails, the network may have changed).
+        """
+        global _CACHED_LOCAL_IP
+        _CACHED_LOCAL_IP = None
 
     async def get_local_ip(self):
         """
         Asynchronously get local IP address.
         """
+        global _CACHED_LOCAL_IP
+        if _CACHED_LOCAL_IP is not None:
+            return _CACHED_LOCAL_IP
         try:
             loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(None, self._sync_get_ip)
+            _CACHED_LOCAL_IP = await loop.run_in_executor(None, self._sync_get_ip)
+            return _CACHED_LOCAL_IP
         except Exception as e:
-            self.logger.error(f"Failed to get local IP: {e}")
+            self.logger.error("Failed to get local IP: %s", e)
             return "127.0.0.1"
 
     def _sync_get_ip(self):
         """
         Synchronously get IP address.
         """
+        if sys.platform.startswith("linux"):
+            try:
+                ip = self._get_ip_via_proc_route()
+                if ip:
+                    return ip
+            except Exception as e:
+                self.logger.debug("Default route lookup failed, falling back to UDP probe: %s", e)
+
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
             s.connect(("8.8.8.8", 80))
             return s.getsockname()[0]
 
-    def build_payload(self):
+    @staticmethod
+    def _get_ip_via_proc_route():
         """
-        Build OTA request payload.
+        Linux: address of the default-route interface, from /proc/net/route and SIOCGIFADDR.
         """
-        # Get hmac_key from efuse.json as elf_sha256
-        hmac_key = self.device_fingerprint.get_hmac_key()
-        elf_sha256 = hmac_key if hmac_key else "unknown"
+        import fcntl
+        import struct
+
+        ifname = None
+        best_metric = None
+        with open("/proc/net/route") as f:
+            next(f)  # Header line
+            for line in f:
+                fields = line.split()
+                # Default route: destination 0.0.0.0 with RTF_UP (0x1) and RTF_GATEWAY (0x2)
+                if fields[1] != "00000000" or int(fields[3], 16) & 0x3 != 0x3:
+                    continue
+                metric = int(fields[6])
+                if best_metric is None or metric < best_metric:
+                    ifname, best_metric = fields[0], metric
+
+        if ifname is None:
+            return None
 
-        return {
-            "application": {
-                "version": SystemConstants.APP_VERSION,
-                "elf_sha256": elf_sha256,
-            },
-            "board": {
-                "type": SystemConstants.BOARD_TYPE,
-                "name": SystemConstants.APP_NAME,
-                "ip": self.local_ip,
-                "mac": self.mac_addr,
-            },
-        }
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            packed = fcntl.ioctl(
+                s.fileno(), 0x8915, struct.pack("256s", ifname[:15].encode())  # SIOCGIFADDR
+            )
+        return socket.inet_ntoa(packed[20:24])
 
-    def build_headers(self):
+    def _build_request_templates(self):
         """
-        Build OTA request headers.
+        Build the OTA headers and payload once, their inputs are fixed after init().
         """
         app_version = SystemConstants.APP_VERSION
         board_type = SystemConstants.BOARD_TYPE
         app_name = SystemConstants.APP_NAME
 
         # Basic headers
-        headers = {
+        self._base_headers = {
             "Device-Id": self.mac_addr,
             "Client-Id": self.config.get_config("SYSTEM_OPTIONS.CLIENT_ID"),
             "Content-Type": "application/json",
             "User-Agent": f"{board_type}/{app_name}-{app_version}",
             "Accept-Language": "zh-CN",
         }
+        # v2 protocol adds the Activation-Version header
+        self._v2_headers = {**self._base_headers, "Activation-Version": app_version}
 
-        # Decide whether to add Activation-Version header based on activation version
-        activation_version = self.config.get_config(
-            "SYSTEM_OPTIONS.NETWORK.ACTIVATION_VERSION", "v1"
-        )
+        self._payload = {
+            "application": {
+                "version": app_version,
+                "elf_sha256": None,
+            },
+            "board": {
+                "type": board_type,
+                "name": app_name,
+                "ip": self.local_ip,
+                "mac": self.mac_addr,
+            },
+        }
 
-        # Only v2 protocol adds Activation-Version header
-        if activation_version == "v2":
-            headers["Activation-Version"] = app_version
-            self.logger.debug(f"v2 protocol: Added Activation-Version header: {app_version}")
-        else:
-            self.logger.debug("v1 protocol: Not adding Activation-Version header")
+    def build_payload(self):
+        """
+        Build OTA request payload.
+        """
+        # Get hmac_key from efuse.json as elf_sha256 (the only per-request field)
+        hmac_key = self.device_fingerprint.get_hmac_key()
+        self._payload["application"]["elf_sha256"] = hmac_key if hmac_key else "unknown"
+        return self._payload
+
+    def build_headers(self):
+        """
+        Build OTA request headers.
+        """
+        # Only v2 protocol adds Activation-Version header (activation_version may be preset
+        # by the initializer after init(), so the variant is picked per request)
+        if self.activation_version == "v2":
+            self.logger.debug("v2 protocol: Added Activation-Version header")
+            return self._v2_headers
 
-        return headers
+        self.logger.debug("v1 protocol: Not adding Activation-Version header")
+        return self._base_headers
 
     async def get_ota_config(self):
         """
@@ -128,48 +244,64 @@ class Ota:
             self.logger.error("OTA URL not configured")
             raise ValueError("OTA URL not configured")
 
+        # A failed request invalidated the local IP, resolve it again for the payload
+        if _CACHED_LOCAL_IP is None:
+            self.local_ip = await self.get_local_ip()
+            self._payload["board"]["ip"] = self.local_ip
+
         headers = self.build_headers()
         payload = self.build_payload()
 
+        if self._session is None or self._session.closed:
+            raise ValueError("OTA client not initialized")
+
         try:
-            # Use aiohttp to send asynchronous request
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    self.ota_version_url, headers=headers, json=payload
-                ) as response:
-                    # Check HTTP status code
-                    if response.status != 200:
-                        self.logger.error(f"OTA server error: HTTP {response.status}")
-                        raise ValueError(f"OTA server returned error status code: {response.status}")
-
-                    # Parse JSON data
-                    response_data = await response.json()
-
-                    # Debug info: print complete OTA response
+            # Use the shared aiohttp session to send asynchronous request
+            async with self._session.post(
+                self.ota_version_url, headers=headers, json=payload
+            ) as response:
+                # Check HTTP status code
+                if response.status != 200:
+                    self.logger.error("OTA server error: HTTP %s", response.status)
+                    raise ValueError(f"OTA server returned error status code: {response.status}")
+
+                # Parse JSON data
+                response_data = await response.json()
+
+                # Debug info: print complete OTA response (only serialize when it will be emitted)
+                if self.logger.isEnabledFor(logging.DEBUG):
                     self.logger.debug(
                         f"OTA server returned data: "
                         f"{json.dumps(response_data, indent=4, ensure_ascii=False)}"
                     )
 
-                    return response_data
+                return response_data
 
         except asyncio.TimeoutError:
             self.logger.error("OTA request timeout, please check network or server status")
+            self.invalidate_local_ip()
             raise ValueError("OTA request timeout! Please try again later.")
 
         except aiohttp.ClientError as e:
-            self.logger.error(f"OTA request failed: {e}")
+            self.logger.error("OTA request failed: %s", e)
+            self.invalidate_local_ip()
             raise ValueError("Unable to connect to OTA server, please check network connection!")
 
-    async def update_mqtt_config(self, response_data):
+    async def update_mqtt_config(self, response_data, updates=None):
         """
         Update MQTT configuration information.
+
+        Args:
+            updates: When given, the change is staged into this dict instead of written
         """
         if "mqtt" in response_data:
             self.logger.info("Found MQTT configuration information")
             mqtt_info = response_data["mqtt"]
             if mqtt_info:
+                if updates is not None:
+                    updates["SYSTEM_OPTIONS.NETWORK.MQTT_INFO"] = mqtt_info
+                    return mqtt_info
+
                 # Update configuration
                 success = self.config.update_config(
                     "SYSTEM_OPTIONS.NETWORK.MQTT_INFO", mqtt_info
@@ -186,47 +318,191 @@ class Ota:
 
         return None
 
-    async def update_websocket_config(self, response_data):
+    async def update_websocket_config(self, response_data, updates=None):
         """
         Update WebSocket configuration information.
+
+        Args:
+            updates: When given, the changes are staged into this dict instead of written
         """
         if "websocket" in response_data:
             self.logger.info("Found WebSocket configuration information")
             websocket_info = response_data["websocket"]
+            staged = {} if updates is None else updates
 
             # Update WebSocket URL
             if "url" in websocket_info:
-                self.config.update_config(
-                    "SYSTEM_OPTIONS.NETWORK.WEBSOCKET_URL", websocket_info["url"]
-                )
-                self.logger.info(f"WebSocket URL updated: {websocket_info['url']}")
+                staged["SYSTEM_OPTIONS.NETWORK.WEBSOCKET_URL"] = websocket_info["url"]
+                self.logger.info("WebSocket URL updated: %s", websocket_info["url"])
 
             # Update WebSocket Token
             token_value = websocket_info.get("token", "test-token") or "test-token"
-            self.config.update_config(
-                "SYSTEM_OPTIONS.NETWORK.WEBSOCKET_ACCESS_TOKEN", token_value
-            )
+            staged["SYSTEM_OPTIONS.NETWORK.WEBSOCKET_ACCESS_TOKEN"] = token_value
             self.logger.info("WebSocket Token updated")
 
+            if updates is None:
+                self.config.update_configs(staged)
+
             return websocket_info
         else:
             self.logger.info("No WebSocket configuration information found")
 
         return None
 
-    async def fetch_and_update_config(self):
+    def _load_cached_response(self):
         """
-        Fetch and update all configuration information.
+        Load the cached OTA response for this device and OTA URL, returns (data, age) or (None, None).
+        """
+        try:
+            cache_file = self.config.config_dir / self.OTA_CACHE_FILE
+            cache = json.loads(cache_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            self.logger.warning("Failed to read OTA cache: %s", e)
+            return None, None
+
+        # A cache written for another device or OTA server does not apply
+        if cache.get("url") != self.ota_version_url or cache.get("mac") != self.mac_addr:
+            return None, None
+        return cache.get("response_data"), time.time() - cache.get("timestamp", 0)
+
+    def _save_cached_response(self, response_data):
+        """
+        Persist a successful OTA response (owner read/write only, it holds access tokens).
+        """
+        try:
+            cache_file = self.config.config_dir / self.OTA_CACHE_FILE
+            fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                # The mode only applies on creation, tighten a cache written by older versions
+                os.chmod(cache_file, 0o600)
+                json.dump(
+                    {
+                        "timestamp": time.time(),
+                        "url": self.ota_version_url,
+                        "mac": self.mac_addr,
+                        "response_data": response_data,
+                    },
+                    f,
+                    ensure_ascii=False,
+                )
+        except Exception as e:
+            self.logger.warning("Failed to write OTA cache: %s", e)
+
+    async def _apply_response_config(self, response_data):
+        """
+        Apply MQTT and WebSocket settings from an OTA response in one configuration write.
+        """
+        updates = {}
+        mqtt_config = await self.update_mqtt_config(response_data, updates)
+        websocket_config = await self.update_websocket_config(response_data, updates)
+
+        if updates:
+            if self.config.update_configs(updates):
+                if mqtt_config:
+                    self.logger.info("MQTT configuration updated")
+            else:
+                self.logger.error("OTA configuration update failed")
+                mqtt_config = None
+
+        return mqtt_config, websocket_config
+
+    @staticmethod
+    def _response_changed(cached, response_data):
+        """
+        Whether a revalidated response affects activation or connection credentials.
+        """
+        return (
+            "activation" in response_data
+            or response_data.get("websocket") != cached.get("websocket")
+            or response_data.get("mqtt") != cached.get("mqtt")
+        )
+
+    async def _refresh_in_background(self, cached):
+        """
+        Revalidate a cached OTA response and apply the fresh configuration.
         """
         try:
-            # Get OTA configuration
             response_data = await self.get_ota_config()
+            self._save_cached_response(response_data)
+            await self._apply_response_config(response_data)
+            self.logger.info("OTA configuration refreshed in background")
+
+            if self._response_changed(cached, response_data):
+                self.logger.warning("Refreshed OTA response differs from the cached one")
+                if self.on_refresh_changed:
+                    self.on_refresh_changed(response_data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.warning("Background OTA refresh failed, keeping cached configuration: %s", e)
+
+    def use_cached_config(self):
+        """
+        Build a fetch_and_update_config() result from the already provisioned configuration,
+        without waiting for the network (no activation data, so no activation is triggered).
+        The OTA request still runs in the background so server-side changes are picked up.
+        """
+        websocket_info = {
+            "url": self.config.get_config("SYSTEM_OPTIONS.NETWORK.WEBSOCKET_URL"),
+            "token": self.config.get_config(
+                "SYSTEM_OPTIONS.NETWORK.WEBSOCKET_ACCESS_TOKEN"
+            ),
+        }
+        mqtt_info = self.config.get_config("SYSTEM_OPTIONS.NETWORK.MQTT_INFO")
+
+        response_data = {"websocket": websocket_info}
+        if mqtt_info:
+            response_data["mqtt"] = mqtt_info
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(
+                self._refresh_in_background(response_data)
+            )
+
+        return {
+            "response_data": response_data,
+            "mqtt_config": mqtt_info or None,
+            "websocket_config": websocket_info,
+        }
+
+    async def fetch_and_update_config(self):
+        """
+        Fetch and update all configuration information.
 
-            # Update MQTT configuration
-            mqtt_config = await self.update_mqtt_config(response_data)
+        Stale-while-revalidate: a fresh cached response (without pending activation) is applied
+        immediately and revalidated in the background, on_refresh_changed is called if the
+        server's answer changed; if the request fails, a stale cached response is used instead.
+        """
+        try:
+            cached, age = self._load_cached_response()
+            usable_cache = cached is not None and "activation" not in cached
+
+            if usable_cache and age < self.OTA_CACHE_TTL:
+                self.logger.info("Using cached OTA configuration (%ss old)", int(age))
+                response_data = cached
+                # v1 has no activation state to revalidate, the cache is enough until it expires
+                if self.activation_version != "v1":
+                    self._refresh_task = asyncio.create_task(
+                        self._refresh_in_background(cached)
+                    )
+            else:
+                try:
+                    # Get OTA configuration
+                    response_data = await self.get_ota_config()
+                except Exception as e:
+                    if not usable_cache:
+                        raise
+                    self.logger.warning("OTA request failed, using stale cached configuration: %s", e)
+                    response_data = cached
+                else:
+                    self._save_cached_response(response_data)
 
-            # Update WebSocket configuration
-            websocket_config = await self.update_websocket_config(response_data)
+            # Update MQTT and WebSocket configuration
+            mqtt_config, websocket_config = await self._apply_response_config(
+                response_data
+            )
 
             # Return complete response data for activation process
             return {
@@ -236,5 +512,5 @@ class Ota:
             }
 
         except Exception as e:
-            self.logger.error(f"Failed to fetch and update configuration: {e}")
+            self.logger.error("Failed to fetch and update configuration: %s", e)
             raise
@@ -5,13 +5,10 @@ Four-stage initialization process test script demonstrating coordination between
 
 import asyncio
 import json
-from pathlib import Path
+import logging
 from typing import Dict
 
 from src.constants.system import InitializationStage
-from src.core.ota import Ota
-from src.utils.config_manager import ConfigManager
-from src.utils.device_fingerprint import DeviceFingerprint
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +23,7 @@ class SystemInitializer:
         self.ota = None
         self.current_stage = None
         self.activation_data = None
+        self._activation_version = None  # Resolved once in stage 2a
         self.activation_status = {
             "local_activated": False,  # Local activation status
             "server_activated": False,  # Server activation status
@@ -41,21 +39,22 @@ class SystemInitializer:
         logger.info("Starting system initialization process")
 
         try:
-            # Stage 1: Device identity preparation
-            await self.stage_1_device_fingerprint()
+            # Stage 1 (device identity) and stage 2a (configuration manager) are independent,
+            # run them concurrently; linking DEVICE_ID needs both
+            await asyncio.gather(
+                self.stage_1_device_fingerprint(), self.stage_2a_init_config_manager()
+            )
 
-            # Stage 2: Configuration management initialization
-            await self.stage_2_config_management()
+            # Stage 2b: Link DEVICE_ID to the device fingerprint
+            await self.stage_2b_link_device_id()
 
             # Stage 3: OTA configuration acquisition
             await self.stage_3_ota_config()
 
-            # Get activation version configuration
-            activation_version = self.config_manager.get_config(
-                "SYSTEM_OPTIONS.NETWORK.ACTIVATION_VERSION", "v1"
-            )
+            # Activation version resolved in stage 2a
+            activation_version = self._activation_version
 
-            logger.info(f"Activation version: {activation_version}")
+            logger.info("Activation version: %s", activation_version)
 
             # Decide whether activation process is needed based on activation version
             if activation_version == "v1":
@@ -85,65 +84,96 @@ class SystemInitializer:
                 return activation_result
 
         except Exception as e:
-            logger.error(f"System initialization failed: {e}")
+            logger.error("System initialization failed: %s", e)
             return {"success": False, "error": str(e), "need_activation_ui": False}
 
     async def stage_1_device_fingerprint(self):
         """
         Stage 1: Device identity preparation.
         """
-        self.current_stage = InitializationStage.DEVICE_FINGERPRINT
-        logger.info(f"Starting {self.current_stage.value}")
-
-        # Initialize device fingerprint
-        self.device_fingerprint = DeviceFingerprint.get_instance()
+        # Local stage name: stage 2a runs concurrently and also sets current_stage
+        stage = InitializationStage.DEVICE_FINGERPRINT
+        self.current_stage = stage
+        logger.info("Starting %s", stage.value)
 
-        # Ensure device identity information is complete
+        # Hardware probing and efuse.json IO run on a worker thread so stage 2a can proceed
         (
             serial_number,
             hmac_key,
             is_activated,
-        ) = self.device_fingerprint.ensure_device_identity()
+            mac_address,
+        ) = await asyncio.to_thread(self._prepare_device_identity)
 
         # Record local activation status
         self.activation_status["local_activated"] = is_activated
 
-        # Get MAC address and ensure lowercase format
-        mac_address = self.device_fingerprint.get_mac_address_from_efuse()
-
-        logger.info(f"Device serial number: {serial_number}")
-        logger.info(f"MAC address: {mac_address}")
-        logger.info(f"HMAC key: {hmac_key[:8] if hmac_key else None}...")
-        logger.info(f"Local activation status: {'Activated' if is_activated else 'Not activated'}")
+        logger.info("Device serial number: %s", serial_number)
+        logger.info("MAC address: %s", mac_address)
+        logger.info("HMAC key: %s...", hmac_key[:8] if hmac_key else None)
+        logger.info("Local activation status: %s", "Activated" if is_activated else "Not activated")
 
         # Verify efuse.json file is complete
-        efuse_file = Path("config/efuse.json")
-        if efuse_file.exists():
-            logger.info(f"efuse.json file location: {efuse_file.absolute()}")
-            with open(efuse_file, "r", encoding="utf-8") as f:
-                efuse_data = json.load(f)
-            logger.debug(
-                f"efuse.json content: "
-                f"{json.dumps(efuse_data, indent=2, ensure_ascii=False)}"
-            )
+        # ensure_device_identity() already read the file, so its cache answers without a stat()
+        efuse_file = self.device_fingerprint.efuse_file
+        if self.device_fingerprint.is_efuse_loaded():
+            logger.info("efuse.json file location: %s", efuse_file.absolute())
+            if logger.isEnabledFor(logging.DEBUG):
+                # Reuse the data the fingerprint already parsed instead of reading the file again
+                efuse_data = self.device_fingerprint.get_efuse_snapshot()
+                logger.debug(
+                    f"efuse.json content: "
+                    f"{json.dumps(efuse_data, indent=2, ensure_ascii=False)}"
+                )
         else:
             logger.warning("efuse.json file does not exist")
 
-        logger.info(f"Completed {self.current_stage.value}")
+        logger.info("Completed %s", stage.value)
+
+    def _prepare_device_identity(self):
+        """
+        Load the device fingerprint and ensure its identity (blocking, runs off the event loop).
+        """
+        from src.utils.device_fingerprint import DeviceFingerprint
+
+        self.device_fingerprint = DeviceFingerprint.get_instance()
+
+        # Ensure device identity information is complete
+        (
+            serial_number,
+            hmac_key,
+            is_activated,
+        ) = self.device_fingerprint.ensure_device_identity()
+
+        # Get MAC address and ensure lowercase format
+        mac_address = self.device_fingerprint.get_mac_address_from_efuse()
+
+        return serial_number, hmac_key, is_activated, mac_address
 
-    async def stage_2_config_management(self):
+    async def stage_2a_init_config_manager(self):
         """
-        Stage 2: Configuration management initialization.
+        Stage 2a: Configuration manager initialization (no fingerprint dependency).
         """
         self.current_stage = InitializationStage.CONFIG_MANAGEMENT
-        logger.info(f"Starting {self.current_stage.value}")
+        logger.info("Starting %s", self.current_stage.value)
 
         # Initialize configuration manager
+        from src.utils.config_manager import ConfigManager
+
         self.config_manager = ConfigManager.get_instance()
 
         # Ensure CLIENT_ID exists
         self.config_manager.initialize_client_id()
 
+        self._activation_version = self.config_manager.get_config(
+            "SYSTEM_OPTIONS.NETWORK.ACTIVATION_VERSION", "v1"
+        )
+
+    async def stage_2b_link_device_id(self):
+        """
+        Stage 2b: Initialize DEVICE_ID from the device fingerprint (after stage 1 and 2a).
+        """
+        self.current_stage = InitializationStage.CONFIG_MANAGEMENT
+
         # Initialize DEVICE_ID from device fingerprint
         self.config_manager.initialize_device_id_from_fingerprint(
             self.device_fingerprint
@@ -153,60 +183,103 @@ class SystemInitializer:
         client_id = self.config_manager.get_config("SYSTEM_OPTIONS.CLIENT_ID")
         device_id = self.config_manager.get_config("SYSTEM_OPTIONS.DEVICE_ID")
 
-        logger.info(f"Client ID: {client_id}")
-        logger.info(f"Device ID: {device_id}")
+        logger.info("Client ID: %s", client_id)
+        logger.info("Device ID: %s", device_id)
 
-        logger.info(f"Completed {self.current_stage.value}")
+        logger.info("Completed %s", self.current_stage.value)
 
     async def stage_3_ota_config(self):
         """
         Stage 3: OTA configuration acquisition.
         """
         self.current_stage = InitializationStage.OTA_CONFIG
-        logger.info(f"Starting {self.current_stage.value}")
+        logger.info("Starting %s", self.current_stage.value)
+
+        # Initialize OTA (imported here so aiohttp is only loaded when OTA actually runs)
+        from src.core.ota import Ota
 
-        # Initialize OTA
         self.ota = await Ota.get_instance()
+        self.ota.activation_version = self._activation_version
+        self.ota.on_refresh_changed = self._on_ota_refreshed
+
+        # v1 deployments with a provisioned URL skip the blocking OTA round-trip (opt out with False)
+        skip_ota = (
+            self._activation_version == "v1"
+            and self.config_manager.get_config(
+                "SYSTEM_OPTIONS.NETWORK.OTA_SKIP_IF_CACHED", True
+            )
+            and self.config_manager.get_config("SYSTEM_OPTIONS.NETWORK.WEBSOCKET_URL")
+        )
 
         # Fetch and update configuration
         try:
-            config_result = await self.ota.fetch_and_update_config()
+            if skip_ota:
+                logger.info("v1 protocol: Using provisioned configuration, refreshing OTA in background")
+                config_result = self.ota.use_cached_config()
+            else:
+                config_result = await self.ota.fetch_and_update_config()
 
             logger.info("OTA configuration acquisition result:")
             mqtt_status = "Acquired" if config_result["mqtt_config"] else "Not acquired"
-            logger.info(f"- MQTT configuration: {mqtt_status}")
+            logger.info("- MQTT configuration: %s", mqtt_status)
 
             ws_status = "Acquired" if config_result["websocket_config"] else "Not acquired"
-            logger.info(f"- WebSocket configuration: {ws_status}")
+            logger.info("- WebSocket configuration: %s", ws_status)
 
             # Display summary of acquired configuration information
             response_data = config_result["response_data"]
-            # Detailed configuration information only displayed in debug mode
-            logger.debug(
-                f"OTA response data: {json.dumps(response_data, indent=2, ensure_ascii=False)}"
-            )
+            # Detailed configuration information only displayed (and serialized) in debug mode
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"OTA response data: {json.dumps(response_data, indent=2, ensure_ascii=False)}"
+                )
 
             if "websocket" in response_data:
                 ws_info = response_data["websocket"]
-                logger.info(f"WebSocket URL: {ws_info.get('url', 'N/A')}")
-
-            # Check if there is activation information
-            if "activation" in response_data:
-                logger.info("Activation information detected, device needs activation")
-                self.activation_data = response_data["activation"]
-                # Server considers device not activated
-                self.activation_status["server_activated"] = False
-            else:
-                logger.info("No activation information detected, device may be activated")
-                self.activation_data = None
-                # Server considers device activated
-                self.activation_status["server_activated"] = True
+                logger.info("WebSocket URL: %s", ws_info.get("url", "N/A"))
+
+            self._update_server_activation(response_data)
 
         except Exception as e:
-            logger.error(f"OTA configuration acquisition failed: {e}")
+            logger.error("OTA configuration acquisition failed: %s", e)
             raise
 
-        logger.info(f"Completed {self.current_stage.value}")
+        logger.info("Completed %s", self.current_stage.value)
+
+    def _update_server_activation(self, response_data):
+        """
+        Record the server activation status carried by an OTA response.
+        """
+        # Check if there is activation information
+        if "activation" in response_data:
+            logger.info("Activation information detected, device needs activation")
+            self.activation_data = response_data["activation"]
+            # Server considers device not activated
+            self.activation_status["server_activated"] = False
+        else:
+            logger.info("No activation information detected, device may be activated")
+            self.activation_data = None
+            # Server considers device activated
+            self.activation_status["server_activated"] = True
+
+    def _on_ota_refreshed(self, response_data):
+        """
+        Re-run the activation check when the background OTA refresh disagrees with the cache.
+        """
+        self._update_server_activation(response_data)
+        if self._activation_version == "v1":
+            return
+
+        result = self.analyze_activation_status()
+        if result["need_activation_ui"]:
+            # The refreshed response (with activation data) is cached and is never served
+            # from cache, so the next start goes through the activation flow
+            logger.error(
+                "Server requires activation again (%s), restart the client to activate",
+                result["status_message"],
+            )
+        else:
+            logger.info("Activation status rechecked: %s", result["status_message"])
 
     def analyze_activation_status(self) -> Dict:
         """Analyze activation status to determine next steps.
@@ -283,7 +356,7 @@ class SystemInitializer:
         """
         Get activation data (for activation module use)
         """
-        return getattr(self, "activation_data", None)
+        return self.activation_data
 
     def get_device_fingerprint(self):
         """
@@ -374,7 +447,7 @@ class SystemInitializer:
             }
 
         except Exception as e:
-            logger.error(f"GUI activation process exception: {e}", exc_info=True)
+            logger.error("GUI activation process exception: %s", e, exc_info=True)
             return {"is_activated": False, "error": str(e)}
 
     async def _run_cli_activation(self) -> Dict:
@@ -399,5 +472,5 @@ class SystemInitializer:
             }
 
         except Exception as e:
-            logger.error(f"CLI activation process exception: {e}", exc_info=True)
+            logger.error("CLI activation process exception: %s", e, exc_info=True)
             return {"is_activated": False, "error": str(e)}
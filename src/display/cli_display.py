@@ -1,46 +1,141 @@
 import asyncio
+import codecs
+import fcntl
 import logging
 import os
-import shutil
+import select
+import signal
 import sys
 import termios
 import tty
+import unicodedata
 from collections import deque
 from typing import Callable, Optional
 
 from src.display.base_display import BaseDisplay
 
+# Pre-encoded control sequences used by the renderers
+_CSI_CLEAR_LINE = b"\x1b[2K"
+_CSI_CLEAR_BELOW = b"\x1b[J"
+_CSI_CLEAR_SCREEN = b"\x1b[2J\x1b[H"
+_CSI_SAVE = b"\x1b7"
+_CSI_RESTORE = b"\x1b8"
+
+# SGR styles (only used in TTY)
+_BOLD_CYAN = "\x1b[1m\x1b[36m"
+_GREEN = "\x1b[32m"
+_RESET = "\x1b[0m"
+
+# Fixed styled texts
+_TITLE = " Xiaozhi AI Terminal "
+_PROMPT = b"Input: "
+_PROMPT_STYLED = f"{_BOLD_CYAN}Input:{_RESET} ".encode()
+_PROMPT_WIDTH = len(_PROMPT)  # Terminal columns taken by either prompt
+
+# Bytes taken from stdin per readable event, large enough that a paste is read in one go
+_STDIN_READ_SIZE = 512
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp for records logged within the same second.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            # The default format includes milliseconds, nothing to reuse
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_text = self._time_cache
+        if second != cached_second:
+            cached_text = super().formatTime(record, datefmt)
+            self._time_cache = (second, cached_text)
+        return cached_text
+
+
+def _char_cells(ch: str) -> int:
+    """
+    Terminal columns taken by one character (CJK wide/fullwidth take 2, combining marks 0).
+    """
+    if unicodedata.combining(ch):
+        return 0
+    return 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+
+
+def _str_cells(s: str) -> int:
+    """
+    Terminal columns taken by a string.
+    """
+    if s.isascii():
+        return len(s)
+    return sum(_char_cells(ch) for ch in s)
+
+
+def _trunc_cells(s: str, limit: int) -> str:
+    """
+    Truncate a string to at most `limit` terminal columns, marking the cut with "…".
+    """
+    if s.isascii():
+        return s if len(s) <= limit else s[: limit - 1] + "…"
+    width = 0
+    cut = None
+    for i, ch in enumerate(s):
+        width += _char_cells(ch)
+        if cut is None and width > limit - 1:
+            cut = i
+        if width > limit:
+            return s[:cut] + "…"
+    return s
+
 
 class CliDisplay(BaseDisplay):
     def __init__(self):
         super().__init__()
         self.running = True
         self._use_ansi = sys.stdout.isatty()
+        # Terminal output is collected into one buffer and written with a single os.write
+        self._stdout_fd = sys.stdout.fileno() if self._use_ansi else None
+        self._out = bytearray()
+        self._prompt = _PROMPT_STYLED if self._use_ansi else _PROMPT
+        # Line input, read from the event loop while stdin is readable
+        self._stdin_fd = sys.stdin.fileno() if self._use_ansi else None
+        self._stdin_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._input_buffer: list[str] = []
+        # Text typed or pasted after an Enter, carried over to the next line read
+        self._input_pending = ""
+        self._line_future: Optional[asyncio.Future] = None
         self._loop = None
         self._last_drawn_rows = 0
+        # Last frame drawn per dashboard row and the terminal size it was drawn for,
+        # so a render only rewrites the rows that changed
+        self._prev_lines: list[str] = []
+        self._prev_size = None
+        # Render requests only mark the dashboard dirty; _render_loop coalesces them
+        self._dirty = asyncio.Event()
+        self._render_task = None
+        self._render_interval = 0.016  # At most ~60 dashboard renders per second
 
         # Dashboard data (top content display area)
         self._dash_status = ""
         self._dash_connected = False
         self._dash_text = ""
         self._dash_emotion = ""
+        # Last (value, limit, result) truncation per dashboard field
+        self._trunc_cache: dict[str, tuple[str, int, str]] = {}
+        # Static box lines (top, title, separator, bottom, blank content row) per terminal size
+        self._border_cache: dict[tuple[int, int], tuple[str, str, str, str, str]] = {}
+        # Terminal size, cached while a SIGWINCH handler keeps it up to date
+        self._cached_size: Optional[tuple[int, int]] = None
+        self._size_tracked = False
         # Layout: only two areas (display area + input area)
         # Reserve two input lines (separator line + input line), plus one extra line for Chinese input overflow cleanup
         self._input_area_lines = 3
         self._dashboard_lines = 8  # Minimum display area lines (will adjust dynamically based on terminal height)
 
-        # Colors/styles (only effective in TTY)
-        self._ansi = {
-            "reset": "\x1b[0m",
-            "bold": "\x1b[1m",
-            "dim": "\x1b[2m",
-            "blue": "\x1b[34m",
-            "cyan": "\x1b[36m",
-            "green": "\x1b[32m",
-            "yellow": "\x1b[33m",
-            "magenta": "\x1b[35m",
-        }
-
         # Callback functions
         self.auto_callback = None
         self.abort_callback = None
@@ -50,8 +145,10 @@ class CliDisplay(BaseDisplay):
         # Async queue for processing commands
         self.command_queue = asyncio.Queue()
 
-        # Log buffer (only displayed at CLI top, not directly printed to console)
-        self._log_lines: deque[str] = deque(maxlen=6)
+        # Log buffer (only displayed at CLI top, not directly printed to console).
+        # Entries are [record, formatted text]; records are formatted only when drawn
+        self._log_records: deque[list] = deque(maxlen=6)
+        self._log_handler: Optional[logging.Handler] = None
         self._install_log_handler()
 
     async def set_callbacks(
@@ -76,40 +173,50 @@ class CliDisplay(BaseDisplay):
         Update button status.
         """
         # Simplified: button status only shown in dashboard text
+        if text == self._dash_text:
+            return
         self._dash_text = text
-        await self._render_dashboard()
+        self._dirty.set()
 
     async def update_status(self, status: str, connected: bool):
         """
         Update status (only update dashboard, don't append new lines).
         """
+        connected = bool(connected)
+        if status == self._dash_status and connected == self._dash_connected:
+            return
         self._dash_status = status
-        self._dash_connected = bool(connected)
-        await self._render_dashboard()
+        self._dash_connected = connected
+        self._dirty.set()
 
     async def update_text(self, text: str):
         """
         Update text (only update dashboard, don't append new lines).
         """
-        if text and text.strip():
-            self._dash_text = text.strip()
-            await self._render_dashboard()
+        text = text.strip() if text else ""
+        if text and text != self._dash_text:
+            self._dash_text = text
+            self._dirty.set()
 
     async def update_emotion(self, emotion_name: str):
         """
         Update emotion (only update dashboard, don't append new lines).
         """
+        if emotion_name == self._dash_emotion:
+            return
         self._dash_emotion = emotion_name
-        await self._render_dashboard()
+        self._dirty.set()
 
     async def start(self):
         """
         Start async CLI display.
         """
         self._loop = asyncio.get_running_loop()
+        self._install_resize_handler()
         await self._init_screen()
 
         # Start command processing tasks
+        self._render_task = asyncio.create_task(self._render_loop())
         command_task = asyncio.create_task(self._command_processor())
         input_task = asyncio.create_task(self._keyboard_input_loop())
 
@@ -117,6 +224,27 @@ class CliDisplay(BaseDisplay):
             await asyncio.gather(command_task, input_task)
         except KeyboardInterrupt:
             await self.close()
+        finally:
+            self._render_task.cancel()
+            if self._size_tracked:
+                self._loop.remove_signal_handler(signal.SIGWINCH)
+                self._size_tracked = False
+
+    async def _render_loop(self):
+        """
+        Render the dashboard when marked dirty, coalescing bursts of updates into one frame.
+        """
+        try:
+            while self.running:
+                await self._dirty.wait()
+                self._dirty.clear()
+                if not self.running:
+                    break
+                self._render_dashboard()
+                # Updates arriving during this interval are folded into the next frame
+                await asyncio.sleep(self._render_interval)
+        except asyncio.CancelledError:
+            pass
 
     async def _command_processor(self):
         """
@@ -124,13 +252,14 @@ class CliDisplay(BaseDisplay):
         """
         while self.running:
             try:
-                command = await asyncio.wait_for(self.command_queue.get(), timeout=1.0)
+                command = await self.command_queue.get()
+                # None is the shutdown sentinel queued by close()
+                if command is None:
+                    break
                 if asyncio.iscoroutinefunction(command):
                     await command()
                 else:
                     command()
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -144,12 +273,17 @@ class CliDisplay(BaseDisplay):
             while self.running:
                 # In TTY, read input from fixed bottom input area
                 if self._use_ansi:
-                    await self._render_input_area()
+                    self._render_input_area()
                     # Take over input (disable terminal echo), redraw input line character by character, completely solve Chinese first character residue
-                    cmd = await asyncio.to_thread(self._read_line_raw)
+                    cmd = await self._read_line()
+                    if cmd is None:
+                        # Ctrl+C, or the display was closed while waiting for input
+                        if self.running:
+                            await self.close()
+                        break
                     # Clear input area (including possible Chinese line break residue) and refresh top content
                     self._clear_input_area()
-                    await self._render_dashboard()
+                    self._dirty.set()
                 else:
                     cmd = await asyncio.to_thread(input)
                 await self._handle_command(cmd.lower().strip())
@@ -162,18 +296,17 @@ class CliDisplay(BaseDisplay):
             def __init__(self, display: "CliDisplay"):
                 super().__init__()
                 self.display = display
+                # Bound once so each record only schedules a plain method call
+                self._append_record = display._log_records.append
+                self._mark_dirty = display._dirty.set
 
             def emit(self, record: logging.LogRecord) -> None:
                 try:
-                    msg = self.format(record)
-                    self.display._log_lines.append(msg)
+                    # Formatting is deferred to the render, records evicted first are never formatted
+                    self._append_record([record, None])
                     loop = self.display._loop
                     if loop and self.display._use_ansi:
-                        loop.call_soon_threadsafe(
-                            lambda: asyncio.create_task(
-                                self.display._render_dashboard()
-                            )
-                        )
+                        loop.call_soon_threadsafe(self._mark_dirty)
                 except Exception:
                     pass
 
@@ -189,12 +322,31 @@ class CliDisplay(BaseDisplay):
         handler = _DisplayLogHandler(self)
         handler.setLevel(logging.WARNING)
         handler.setFormatter(
-            logging.Formatter(
+            _SecondCachedFormatter(
                 fmt="%(asctime)s [%(name)s] - %(levelname)s - %(message)s",
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
         )
         root.addHandler(handler)
+        self._log_handler = handler
+
+    def _recent_logs(self, count: int) -> list[str]:
+        """
+        Format (once) and return the newest `count` buffered log lines.
+        """
+        if count <= 0:
+            return []
+        # Snapshot first, the handler may append from other threads
+        entries = list(self._log_records)[-count:]
+        for entry in entries:
+            if entry[1] is None:
+                try:
+                    text = self._log_handler.format(entry[0])
+                except Exception:
+                    text = entry[0].getMessage()
+                # Only the first line fits a dashboard row (e.g. skip tracebacks)
+                entry[1] = text.split("\n", 1)[0]
+        return [entry[1] for entry in entries]
 
     async def _handle_command(self, cmd: str):
         """
@@ -219,6 +371,10 @@ class CliDisplay(BaseDisplay):
         Close CLI display.
         """
         self.running = False
+        # Wake the render loop and a pending line read so they can exit
+        self._dirty.set()
+        self._end_line(None)
+        self.command_queue.put_nowait(None)
         print("\nClosing application...\n")
 
     def _print_help(self):
@@ -234,102 +390,221 @@ class CliDisplay(BaseDisplay):
         """
         if self._use_ansi:
             # Clear screen and return to top-left
-            sys.stdout.write("\x1b[2J\x1b[H")
-            sys.stdout.flush()
+            self._out += _CSI_CLEAR_SCREEN
+            self._flush()
 
         # Initial full rendering
-        await self._render_dashboard(full=True)
-        await self._render_input_area()
+        self._render_dashboard(full=True)
+        self._render_input_area()
+
+    def _goto(self, row: int, col: int = 1, out: Optional[bytearray] = None):
+        buf = self._out if out is None else out
+        buf += f"\x1b[{max(1,row)};{max(1,col)}H".encode()
+
+    def _emit(self, s: str, out: Optional[bytearray] = None):
+        buf = self._out if out is None else out
+        buf += s.encode("utf-8")
+
+    def _flush(self, out: Optional[bytearray] = None):
+        """
+        Write the buffered output to the terminal in one call and reset the buffer.
+        """
+        buf = self._out if out is None else out
+        if not buf:
+            return
+        if self._stdout_fd is None:
+            sys.stdout.write(buf.decode("utf-8"))
+            sys.stdout.flush()
+        else:
+            # Keep the output order consistent with anything written through sys.stdout
+            sys.stdout.flush()
+            self._write_bytes(buf)
+        buf.clear()
 
-    def _goto(self, row: int, col: int = 1):
-        sys.stdout.write(f"\x1b[{max(1,row)};{max(1,col)}H")
+    def _write_bytes(self, data) -> None:
+        """
+        Write bytes straight to the stdout fd, bypassing the text wrapper's lock and encoder.
+        """
+        fd = self._stdout_fd
+        total = len(data)
+        written = 0
+        while written < total:
+            try:
+                written += os.write(fd, data[written:] if written else data)
+            except BlockingIOError:
+                # stdout usually shares the tty with stdin, which is non-blocking while a
+                # line is being read; wait until the terminal drains
+                select.select([], [fd], [], 0.1)
+
+    def _install_resize_handler(self):
+        """
+        Track terminal resizes via SIGWINCH so the size isn't queried on every render.
+        """
+        if not self._use_ansi or not hasattr(signal, "SIGWINCH"):
+            return
+        try:
+            self._loop.add_signal_handler(signal.SIGWINCH, self._on_resize)
+            self._size_tracked = True
+        except (NotImplementedError, RuntimeError, ValueError) as e:
+            self.logger.debug(f"Terminal resize tracking unavailable: {e}")
+
+    def _on_resize(self):
+        self._cached_size = None
+        self._border_cache.clear()
+        self._dirty.set()
 
     def _term_size(self):
+        size = self._cached_size
+        if size is not None:
+            return size
         try:
-            size = shutil.get_terminal_size(fallback=(80, 24))
-            return size.columns, size.lines
-        except Exception:
-            return 80, 24
+            ts = os.get_terminal_size(self._stdout_fd)
+            size = (ts.columns or 80, ts.lines or 24)
+        except (OSError, TypeError, ValueError):
+            size = (80, 24)
+        if self._size_tracked:
+            self._cached_size = size
+        return size
 
     # ====== Raw input (Raw mode) support, avoiding Chinese residue ======
-    def _read_line_raw(self) -> str:
+    async def _read_line(self) -> Optional[str]:
         """
-        Read a line using raw mode: disable echo, read character by character and echo manually, avoid wide character (Chinese) deletion residue through whole line redraw.
+        Read a line using raw mode: disable echo, read from the event loop as stdin becomes
+        readable and echo manually, avoid wide character (Chinese) deletion residue through
+        whole line redraw. Returns None on Ctrl+C or when the display is closed.
         """
-        fd = sys.stdin.fileno()
+        fd = self._stdin_fd
         old_settings = termios.tcgetattr(fd)
+        old_flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+        self._input_buffer = []
+        self._line_future = self._loop.create_future()
+        pending, self._input_pending = self._input_pending, ""
         try:
             tty.setraw(fd)
-            buffer: list[str] = []
-            while True:
-                ch = os.read(fd, 4)  # Read up to 4 bytes, enough to cover common UTF-8 Chinese
-                if not ch:
-                    break
-                try:
-                    s = ch.decode("utf-8")
-                except UnicodeDecodeError:
-                    # If unable to form complete UTF-8, continue reading until decodable
-                    while True:
-                        ch += os.read(fd, 1)
-                        try:
-                            s = ch.decode("utf-8")
-                            break
-                        except UnicodeDecodeError:
-                            continue
-
-                if s in ("\r", "\n"):
-                    # Enter: new line, end input
-                    sys.stdout.write("\r\n")
-                    sys.stdout.flush()
-                    break
-                elif s in ("\x7f", "\b"):
-                    # Backspace: delete one Unicode character
-                    if buffer:
-                        buffer.pop()
-                    # Whole line redraw, avoid Chinese wide character residue
+            fcntl.fcntl(fd, fcntl.F_SETFL, old_flags | os.O_NONBLOCK)
+            self._loop.add_reader(fd, self._on_stdin_ready)
+            if pending:
+                # Type-ahead from the previous read, may already complete this line
+                self._consume_input(pending)
+            return await self._line_future
+        finally:
+            self._loop.remove_reader(fd)
+            fcntl.fcntl(fd, fcntl.F_SETFL, old_flags)
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+            self._line_future = None
+
+    def _end_line(self, line: Optional[str]):
+        future = self._line_future
+        if future is not None and not future.done():
+            future.set_result(line)
+
+    def _on_stdin_ready(self):
+        """
+        Consume whatever stdin has buffered and update the input line.
+        """
+        try:
+            data = os.read(self._stdin_fd, _STDIN_READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            # EOF: end input with what has been typed
+            self._end_line("".join(self._input_buffer))
+            return
+
+        # The incremental decoder keeps partial UTF-8 sequences until their remaining bytes
+        # arrive, across reads and across lines
+        text = self._stdin_decoder.decode(data)
+        future = self._line_future
+        if future is None or future.done():
+            # The line already ended and its reader is about to be removed, keep the input
+            self._input_pending += text
+            return
+        self._consume_input(text)
+
+    def _consume_input(self, text: str):
+        """
+        Apply decoded input to the current line, echoing it in one write.
+        """
+        buffer = self._input_buffer
+        echo = bytearray()
+        redraw = False
+        for i, ch in enumerate(text):
+            if ch in ("\r", "\n"):
+                # Enter: new line, end input; the rest is kept for the next line read
+                rest = text[i + 1 :]
+                if ch == "\r" and rest.startswith("\n"):
+                    rest = rest[1:]
+                self._input_pending += rest
+                if redraw:
                     self._redraw_input_line("".join(buffer))
-                elif s == "\x03":  # Ctrl+C
-                    raise KeyboardInterrupt
+                echo += b"\r\n"
+                self._flush(echo)
+                self._end_line("".join(buffer))
+                return
+            elif ch in ("\x7f", "\b"):
+                # Backspace: delete one Unicode character
+                if buffer:
+                    buffer.pop()
+                # Whole line redraw, avoid Chinese wide character residue
+                redraw = True
+            elif ch == "\x03":  # Ctrl+C
+                self._end_line(None)
+                return
+            else:
+                buffer.append(ch)
+                if not redraw and ch.isascii() and ch.isprintable() and self._input_fits(buffer):
+                    # Plain ASCII that still fits on the line: just echo it at the cursor
+                    echo += ch.encode()
                 else:
-                    buffer.append(s)
-                    self._redraw_input_line("".join(buffer))
+                    # Wide characters or horizontal scrolling need the whole line redrawn
+                    redraw = True
 
-            return "".join(buffer)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        if redraw:
+            self._redraw_input_line("".join(buffer))
+        else:
+            self._flush(echo)
+
+    def _input_fits(self, buffer: list[str]) -> bool:
+        """
+        Whether the input buffer is shown in full (not scrolled) by _redraw_input_line.
+        """
+        cols, _ = self._term_size()
+        return sum(map(len, buffer)) <= max(1, cols - _PROMPT_WIDTH - 1)
 
     def _redraw_input_line(self, content: str) -> None:
         """
         Clear input line and rewrite current content, ensuring no Chinese deletion residue.
         """
+        # Echo output is written on its own, separate from the dashboard's self._out buffer
+        out = bytearray()
         cols, rows = self._term_size()
         separator_row = max(1, rows - self._input_area_lines + 1)
         first_input_row = min(rows, separator_row + 1)
-        prompt = "Input: " if not self._use_ansi else "\x1b[1m\x1b[36mInput:\x1b[0m "
-        self._goto(first_input_row, 1)
-        sys.stdout.write("\x1b[2K")
+        self._goto(first_input_row, 1, out)
+        out += _CSI_CLEAR_LINE
         visible = content
         # Avoid exceeding one line causing line wrap
-        max_len = max(1, cols - len("Input: ") - 1)
+        max_len = max(1, cols - _PROMPT_WIDTH - 1)
         if len(visible) > max_len:
             visible = visible[-max_len:]
-        sys.stdout.write(f"{prompt}{visible}")
-        sys.stdout.flush()
+        out += self._prompt
+        self._emit(visible, out)
+        self._flush(out)
 
-    async def _render_dashboard(self, full: bool = False):
+    def _render_dashboard(self, full: bool = False):
         """
         Update content display in top fixed area, without touching bottom input line.
         """
 
         # Truncate long text to avoid line breaks tearing interface
-        def trunc(s: str, limit: int = 80) -> str:
-            return s if len(s) <= limit else s[: limit - 1] + "…"
-
+        trunc = self._trunc_field
         lines = [
-            f"Status: {trunc(self._dash_status)}",
+            f"Status: {trunc('status', self._dash_status)}",
             f"Connection: {'Connected' if self._dash_connected else 'Not Connected'}",
-            f"Emotion: {trunc(self._dash_emotion)}",
-            f"Text: {trunc(self._dash_text)}",
+            f"Emotion: {trunc('emotion', self._dash_emotion)}",
+            f"Text: {trunc('text', self._dash_text)}",
         ]
 
         if not self._use_ansi:
@@ -342,63 +617,95 @@ class CliDisplay(BaseDisplay):
         # Available display rows = total terminal rows - input area rows
         usable_rows = max(5, rows - self._input_area_lines)
 
-        # Simple styling function
-        def style(s: str, *names: str) -> str:
-            if not self._use_ansi:
-                return s
-            prefix = "".join(self._ansi.get(n, "") for n in names)
-            return f"{prefix}{s}{self._ansi['reset']}"
-
-        title = style(" Xiaozhi AI Terminal ", "bold", "cyan")
-        # Header and footer boxes
-        top_bar = "┌" + ("─" * (max(2, cols - 2))) + "┐"
-        title_line = "│" + title.center(max(2, cols - 2)) + "│"
-        sep_line = "├" + ("─" * (max(2, cols - 2))) + "┤"
-        bottom_bar = "└" + ("─" * (max(2, cols - 2))) + "┘"
+        inner = max(2, cols - 2)
+
+        # Header and footer boxes only change with the terminal size
+        size = (cols, rows)
+        borders = self._border_cache.get(size)
+        if borders is None:
+            horizontal = "─" * inner
+            # Fit the plain title like the body rows, then center it by its width
+            # (escape codes take no columns)
+            title = _trunc_cells(_TITLE, inner)
+            pad = max(0, inner - len(title))
+            title = " " * (pad // 2) + f"{_BOLD_CYAN}{title}{_RESET}" + " " * (pad - pad // 2)
+            borders = (
+                ("┌" + horizontal + "┐")[:cols],
+                "│" + title + "│",
+                ("├" + horizontal + "┤")[:cols],
+                ("└" + horizontal + "┘")[:cols],
+                " " * inner,
+            )
+            self._border_cache[size] = borders
+        top_bar, title_line, sep_line, bottom_bar, blank = borders
+        empty_row = "│" + blank + "│"
 
         # Content area available rows (minus 4 lines for top and bottom boxes)
         body_rows = max(1, usable_rows - 4)
+        # Recent logs fill the rows left below the status lines, after one blank row
+        if self._log_records and body_rows > len(lines) + 1:
+            lines.append("")
+            lines.extend(self._recent_logs(body_rows - len(lines)))
         body = []
-        for i in range(body_rows):
-            text = lines[i] if i < len(lines) else ""
-            text = style(text, "green") if i == 0 else text
-            body.append("│" + text.ljust(max(2, cols - 2))[: max(2, cols - 2)] + "│")
-
+        for i, text in enumerate(lines[:body_rows]):
+            # Fit and pad by terminal columns so wide characters keep the right border aligned
+            text = _trunc_cells(text, inner)
+            padding = blank[_str_cells(text) :]
+            if i == 0:
+                # Status line style, applied around the text only (padding stays unstyled)
+                text = f"{_GREEN}{text}{_RESET}"
+            body.append(f"│{text}{padding}│")
+        body.extend([empty_row] * (body_rows - len(body)))
+
+        # Frame rows: header (3 lines) + content rows + footer (1 line)
+        new_lines = [top_bar, title_line, sep_line]
+        new_lines.extend(body)
+        new_lines.append(bottom_bar)
+        total_rows = len(new_lines)
+
+        # A resize (or an explicit full render) invalidates what is on screen
+        if full or size != self._prev_size:
+            self._prev_lines = []
+            self._prev_size = size
+        prev = self._prev_lines
+
+        # Only rewrite rows whose content changed, batched into one write
+        out = self._out
         # Save cursor position
-        sys.stdout.write("\x1b7")
-
-        # Completely clear previous frame's possible residue before drawing to avoid visual "double layers"
-        total_rows = 4 + body_rows  # Top box 3 lines + bottom box 1 line + content rows
-        rows_to_clear = max(self._last_drawn_rows, total_rows)
-        for i in range(rows_to_clear):
-            self._goto(1 + i, 1)
-            sys.stdout.write("\x1b[2K")
-
-        # Draw header
-        self._goto(1, 1)
-        sys.stdout.write("\x1b[2K" + top_bar[:cols])
-        self._goto(2, 1)
-        sys.stdout.write("\x1b[2K" + title_line[:cols])
-        self._goto(3, 1)
-        sys.stdout.write("\x1b[2K" + sep_line[:cols])
-
-        # Draw body
-        for idx in range(body_rows):
-            self._goto(4 + idx, 1)
-            sys.stdout.write("\x1b[2K")
-            sys.stdout.write(body[idx][:cols])
-
-        # Draw footer
-        self._goto(4 + body_rows, 1)
-        sys.stdout.write("\x1b[2K" + bottom_bar[:cols])
-
-        # Restore cursor position
-        sys.stdout.write("\x1b8")
-        sys.stdout.flush()
-
-        # Record this drawing height
+        out += _CSI_SAVE
+        start = len(out)
+        for i, line in enumerate(new_lines):
+            if i >= len(prev) or prev[i] != line:
+                self._goto(i + 1, 1)
+                out += _CSI_CLEAR_LINE
+                self._emit(line)
+        # Clear rows left over from a taller previous frame
+        for i in range(total_rows, max(self._last_drawn_rows, len(prev))):
+            self._goto(i + 1, 1)
+            out += _CSI_CLEAR_LINE
+
+        if len(out) > start:
+            # Restore cursor position
+            out += _CSI_RESTORE
+            self._flush()
+        else:
+            out.clear()
+
+        # Record this frame and its drawing height
+        self._prev_lines = new_lines
         self._last_drawn_rows = total_rows
 
+    def _trunc_field(self, name: str, s: str, limit: int = 80) -> str:
+        """
+        Truncate a dashboard field by terminal columns, reusing the result while it is unchanged.
+        """
+        cached = self._trunc_cache.get(name)
+        if cached and cached[0] == s and cached[1] == limit:
+            return cached[2]
+        result = _trunc_cells(s, limit)
+        self._trunc_cache[name] = (s, limit, result)
+        return result
+
     def _clear_input_area(self):
         if not self._use_ansi:
             return
@@ -406,13 +713,19 @@ class CliDisplay(BaseDisplay):
         separator_row = max(1, rows - self._input_area_lines + 1)
         first_input_row = min(rows, separator_row + 1)
         second_input_row = min(rows, separator_row + 2)
-        # Clear separator line and two input lines in sequence, avoid Chinese wide character echo residue
-        for r in [separator_row, first_input_row, second_input_row]:
-            self._goto(r, 1)
-            sys.stdout.write("\x1b[2K")
-        sys.stdout.flush()
+        # Clear separator line and the input lines, avoid Chinese wide character echo residue
+        if separator_row > self._last_drawn_rows:
+            # The input area is the bottom of the screen: erase from the separator down at once
+            self._goto(separator_row, 1)
+            self._out += _CSI_CLEAR_BELOW
+        else:
+            # Terminal too short, the dashboard reaches into the input area; clear line by line
+            for r in [separator_row, first_input_row, second_input_row]:
+                self._goto(r, 1)
+                self._out += _CSI_CLEAR_LINE
+        self._flush()
 
-    async def _render_input_area(self):
+    def _render_input_area(self):
         if not self._use_ansi:
             return
         cols, rows = self._term_size()
@@ -420,29 +733,28 @@ class CliDisplay(BaseDisplay):
         first_input_row = min(rows, separator_row + 1)
         second_input_row = min(rows, separator_row + 2)
 
+        out = self._out
         # Save cursor
-        sys.stdout.write("\x1b7")
+        out += _CSI_SAVE
         # Separator line
         self._goto(separator_row, 1)
-        sys.stdout.write("\x1b[2K")
-        sys.stdout.write("═" * max(1, cols))
+        out += _CSI_CLEAR_LINE
+        self._emit("═" * max(1, cols))
 
         # Input prompt line (clear and write prompt)
         self._goto(first_input_row, 1)
-        sys.stdout.write("\x1b[2K")
-        prompt = "Input: " if not self._use_ansi else "\x1b[1m\x1b[36mInput:\x1b[0m "
-        sys.stdout.write(prompt)
+        out += _CSI_CLEAR_LINE
+        out += self._prompt
 
         # Reserve one line for overflow cleanup
         self._goto(second_input_row, 1)
-        sys.stdout.write("\x1b[2K")
-        sys.stdout.flush()
+        out += _CSI_CLEAR_LINE
 
         # Restore cursor to original position, then move cursor to input position for input use
-        sys.stdout.write("\x1b8")
+        out += _CSI_RESTORE
         self._goto(first_input_row, 1)
-        sys.stdout.write(prompt)
-        sys.stdout.flush()
+        out += self._prompt
+        self._flush()
 
     async def toggle_mode(self):
         """
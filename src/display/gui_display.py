@@ -1,3 +1,4 @@
+import asyncio
 import os
 from abc import ABCMeta
 from pathlib import Path
@@ -17,6 +18,9 @@ from PyQt5.QtWidgets import (
 from src.display.base_display import BaseDisplay
 from src.utils.resource_finder import find_assets_dir
 
+# Emotion asset extensions, in matching priority order
+EMOTION_EXTENSIONS = (".gif", ".png", ".jpg", ".jpeg", ".webp")
+
 
 # Create compatible metaclass
 class CombinedMeta(type(QObject), ABCMeta):
@@ -44,6 +48,7 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         # Emotion management
         self.emotion_movie = None
         self._emotion_cache = {}
+        self._emotion_index = None  # Emotion name -> asset path, built by one directory scan
         self._last_emotion_name = None
 
         # State management
@@ -153,22 +158,23 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         """
         Update status text and handle related logic.
         """
-        full_status_text = f"Status: {status}"
-        self._safe_update_label(self.status_label, full_status_text)
-
         # Track both status text changes and connection status changes
         new_connected = bool(connected)
         status_changed = status != self.current_status
         connected_changed = new_connected != self.is_connected
 
-        if status_changed:
-            self.current_status = status
-        if connected_changed:
-            self.is_connected = new_connected
+        # Nothing to repaint when neither changed
+        if not (status_changed or connected_changed):
+            return
+
+        full_status_text = f"Status: {status}"
+        self._safe_update_label(self.status_label, full_status_text)
+
+        self.current_status = status
+        self.is_connected = new_connected
 
         # Update system tray on any change
-        if status_changed or connected_changed:
-            self._update_system_tray(status)
+        self._update_system_tray(status)
 
     async def update_text(self, text: str):
         """
@@ -184,7 +190,15 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             return
 
         self._last_emotion_name = emotion_name
-        asset_path = self._get_emotion_asset_path(emotion_name)
+        asset_path = self._emotion_cache.get(emotion_name)
+        if asset_path is None:
+            # Resolving may hit the filesystem, keep it off the UI/event loop thread
+            asset_path = await asyncio.to_thread(
+                self._get_emotion_asset_path, emotion_name
+            )
+            # A newer emotion arrived while resolving, let that one win
+            if emotion_name != self._last_emotion_name:
+                return
 
         if self.emotion_label:
             try:
@@ -199,38 +213,45 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         if emotion_name in self._emotion_cache:
             return self._emotion_cache[emotion_name]
 
-        assets_dir = find_assets_dir()
-        if not assets_dir:
-            path = "😊"
-        else:
-            emotion_dir = assets_dir / "emojis"
-            # Supported extension priority: gif > png > jpg > jpeg > webp
-            candidates = [
-                emotion_dir / f"{emotion_name}.gif",
-                emotion_dir / f"{emotion_name}.png",
-                emotion_dir / f"{emotion_name}.jpg",
-                emotion_dir / f"{emotion_name}.jpeg",
-                emotion_dir / f"{emotion_name}.webp",
-            ]
-            # Match in order
-            found = next((p for p in candidates if p.exists()), None)
-
-            # Fallback to neutral with same rules
-            if not found:
-                neutral_candidates = [
-                    emotion_dir / "neutral.gif",
-                    emotion_dir / "neutral.png",
-                    emotion_dir / "neutral.jpg",
-                    emotion_dir / "neutral.jpeg",
-                    emotion_dir / "neutral.webp",
-                ]
-                found = next((p for p in neutral_candidates if p.exists()), None)
-
-            path = str(found) if found else "😊"
+        if self._emotion_index is None:
+            self._emotion_index = self._build_emotion_index()
+
+        # Fallback to neutral with same rules
+        path = (
+            self._emotion_index.get(emotion_name)
+            or self._emotion_index.get("neutral")
+            or "😊"
+        )
 
         self._emotion_cache[emotion_name] = path
         return path
 
+    def _build_emotion_index(self) -> dict:
+        """
+        Scan the emojis directory once and map each emotion name to its asset path.
+        """
+        assets_dir = find_assets_dir()
+        if not assets_dir:
+            return {}
+
+        # Supported extension priority: gif > png > jpg > jpeg > webp
+        priority = {ext: rank for rank, ext in enumerate(EMOTION_EXTENSIONS)}
+        best = {}
+        try:
+            with os.scandir(assets_dir / "emojis") as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    rank = priority.get(ext)
+                    if rank is None or not entry.is_file():
+                        continue
+                    if stem not in best or rank < best[stem][0]:
+                        best[stem] = (rank, entry.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to scan emotion assets: {e}")
+            return {}
+
+        return {stem: path for stem, (_, path) in best.items()}
+
     def _set_emotion_asset(self, label, asset_path: str):
         """
         Set emotion asset (GIF animation or static image).
@@ -472,9 +493,17 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             from src.views.components.system_tray import SystemTray
 
             self.system_tray = SystemTray(self.root)
-            self.system_tray.show_window_requested.connect(self._show_main_window)
-            self.system_tray.settings_requested.connect(self._on_settings_button_click)
-            self.system_tray.quit_requested.connect(self._quit_application)
+            # Queued so the slots run after the tray menu/activation handler has returned
+            # (the settings dialog runs a modal loop) without wrapping each in a timer
+            self.system_tray.show_window_requested.connect(
+                self._show_main_window, Qt.QueuedConnection
+            )
+            self.system_tray.settings_requested.connect(
+                self._on_settings_button_click, Qt.QueuedConnection
+            )
+            self.system_tray.quit_requested.connect(
+                self._quit_application, Qt.QueuedConnection
+            )
 
         except Exception as e:
             self.logger.error(f"Failed to initialize system tray component: {e}", exc_info=True)
@@ -484,6 +513,11 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         Set default emotion.
         """
         try:
+            # Index all emotion assets up front, off the UI thread, so later emotion
+            # changes only read from memory
+            if self._emotion_index is None:
+                self._emotion_index = await asyncio.to_thread(self._build_emotion_index)
+            self._emotion_cache.update(self._emotion_index)
             await self.update_emotion("neutral")
         except Exception as e:
             self.logger.error(f"Failed to set default emotion: {e}", exc_info=True)
@@ -523,8 +557,6 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             app = Application.get_instance()
             if app:
                 # Asynchronously start shutdown process but set timeout
-                import asyncio
-
                 from PyQt5.QtCore import QTimer
 
                 loop = asyncio.get_event_loop()
@@ -624,8 +656,6 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.text_input.clear()
 
         try:
-            import asyncio
-
             task = asyncio.create_task(self.send_text_callback(text))
 
             def _on_done(t):
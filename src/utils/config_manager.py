@@ -25,6 +25,8 @@ class ConfigManager:
                 "MQTT_INFO": None,
                 "ACTIVATION_VERSION": "v2",  # Optional values: v1, v2
                 "AUTHORIZATION_URL": "https://xiaozhi.me/",
+                # v1 only: start from the provisioned WEBSOCKET_URL and revalidate OTA in the background
+                "OTA_SKIP_IF_CACHED": True,
             },
         },
         "WAKE_WORD_OPTIONS": {
@@ -71,7 +73,8 @@ class ConfigManager:
             "output_device_id": None,
             "output_device_name": None,
             "input_sample_rate": None,
-            "output_sample_rate": None
+            "output_sample_rate": None,
+            "resample_quality": "HQ",  # soxr quality: QQ/LQ/MQ/HQ/VHQ
         }
     }
 
@@ -98,6 +101,9 @@ class ConfigManager:
         # Ensure necessary directories exist
         self._ensure_required_directories()
 
+        # Resolved dotted-path lookups of scalar values, cleared whenever the configuration changes
+        self._lookup_cache: Dict[str, Any] = {}
+
         # Load configuration
         self._config = self._load_config()
 
@@ -207,13 +213,20 @@ class ConfigManager:
         Get configuration value by path
         path: Dot-separated configuration path, e.g. "SYSTEM_OPTIONS.NETWORK.MQTT_INFO"
         """
+        try:
+            return self._lookup_cache[path]
+        except KeyError:
+            pass
         try:
             value = self._config
             for key in path.split("."):
                 value = value[key]
-            return value
         except (KeyError, TypeError):
             return default
+        # Only cache immutable leaves, dicts and lists are live sections callers may mutate
+        if not isinstance(value, (dict, list)):
+            self._lookup_cache[path] = value
+        return value
 
     def update_config(self, path: str, value: Any) -> bool:
         """
@@ -226,17 +239,37 @@ class ConfigManager:
             for part in parts:
                 current = current.setdefault(part, {})
             current[last] = value
+            self._lookup_cache.clear()
             return self._save_config(self._config)
         except Exception as e:
             logger.error(f"Configuration update error {path}: {e}")
             return False
 
+    def update_configs(self, updates: Dict[str, Any]) -> bool:
+        """
+        Update several configuration items with a single file write
+        updates: Mapping of dot-separated configuration paths to values
+        """
+        try:
+            for path, value in updates.items():
+                current = self._config
+                *parts, last = path.split(".")
+                for part in parts:
+                    current = current.setdefault(part, {})
+                current[last] = value
+            self._lookup_cache.clear()
+            return self._save_config(self._config)
+        except Exception as e:
+            logger.error(f"Configuration update error {list(updates)}: {e}")
+            return False
+
     def reload_config(self) -> bool:
         """
         Reload configuration file.
         """
         try:
             self._config = self._load_config()
+            self._lookup_cache.clear()
             logger.info("Configuration file reloaded")
             return True
         except Exception as e:
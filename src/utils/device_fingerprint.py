@@ -407,6 +407,18 @@ class DeviceFingerprint:
 
         return serial_number, hmac_key, is_activated
 
+    def is_efuse_loaded(self) -> bool:
+        """
+        Check whether efuse.json has been read successfully (no filesystem access).
+        """
+        return self._efuse_cache is not None
+
+    def get_efuse_snapshot(self) -> Dict:
+        """
+        Get the already loaded efuse data (no file re-read).
+        """
+        return self._load_efuse_data()
+
     def has_serial_number(self) -> bool:
         """
         Check if serial number exists.
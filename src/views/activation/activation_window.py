@@ -6,7 +6,7 @@ Device activation window. Displays activation process, device information and ac
 from pathlib import Path
 from typing import Optional
 
-from PyQt5.QtCore import QSize, pyqtSignal, QUrl, Qt
+from PyQt5.QtCore import QSize, QTimer, pyqtSignal, QUrl, Qt
 from PyQt5.QtQuickWidgets import QQuickWidget
 from PyQt5.QtWidgets import QApplication, QVBoxLayout, QWidget
 from PyQt5.QtGui import QPainterPath, QRegion
@@ -59,6 +59,12 @@ class ActivationWindow(BaseWindow, AsyncMixin):
 
         # Window drag related
         self.drag_position = None
+        # Drag moves are coalesced: the latest target is applied at most every 8ms
+        self._pending_move = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(8)
+        self._move_timer.timeout.connect(self._flush_move)
 
         # Delayed initialization start (after event loop is running)
         self.start_update_timer(100)  # Start initialization after 100ms
@@ -484,15 +490,28 @@ class ActivationWindow(BaseWindow, AsyncMixin):
         Mouse move event - implement window dragging.
         """
         if event.buttons() == Qt.LeftButton and self.drag_position:
-            self.move(event.globalPos() - self.drag_position)
+            self._pending_move = event.globalPos() - self.drag_position
+            if not self._move_timer.isActive():
+                self._move_timer.start()
             event.accept()
 
     def mouseReleaseEvent(self, event):
         """
         Mouse release event.
         """
+        # Apply the last drag position right away
+        self._move_timer.stop()
+        self._flush_move()
         self.drag_position = None
 
+    def _flush_move(self):
+        """
+        Move the window to the latest pending drag position.
+        """
+        if self._pending_move is not None:
+            self.move(self._pending_move)
+            self._pending_move = None
+
     def _apply_native_rounded_corners(self):
         """
         Apply native rounded corner window shape.